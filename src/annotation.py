@@ -9,6 +9,7 @@ Each annotation is a dict with:
     width    – line thickness in pixels
     points   – list of [x, y] (normalised 0-1 relative to single-eye frame)
     text     – (text type only) the string to draw
+    aa       – (optional) anti-alias strokes; defaults to width <= 2
 
 The web UI works in normalised coordinates so annotations remain
 resolution-independent and apply correctly to both eyes of the SBS
@@ -17,14 +18,24 @@ buffer.
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import math
 import threading
-from typing import Any
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
 
 import cv2
 import numpy as np
-from bidi.algorithm import get_display
-from PIL import ImageFont, ImageDraw, Image
+
+# Pillow and python-bidi are only needed for text annotations; they are
+# imported lazily in _load_font() / _text_sprite() to keep them off the
+# startup path.  Without them text falls back to cv2.putText (ASCII only).
+_PIL_AVAILABLE = (importlib.util.find_spec("PIL") is not None
+                  and importlib.util.find_spec("bidi") is not None)
+
+if TYPE_CHECKING:
+    from PIL import ImageFont
 
 
 def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
@@ -33,6 +44,7 @@ def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     Tries platform fonts in preference order, falls back to Pillow default.
     """
     import os, platform
+    from PIL import ImageFont
 
     candidates: list[str] = []
     if platform.system() == "Windows":
@@ -79,11 +91,122 @@ def _get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     return _font_cache[size]
 
 
+@functools.lru_cache(maxsize=128)
+def _text_sprite(
+    text: str, font_size: int, rgb_color: tuple[int, int, int]
+) -> tuple[int, int, np.ndarray, np.ndarray] | None:
+    """Rasterise *text* once and cache it as an alpha-blendable sprite.
+
+    Returns ``(dx, dy, fg, inv_alpha)`` where ``(dx, dy)`` is the sprite's
+    offset from the Pillow text origin, ``fg`` is the premultiplied BGR
+    foreground and ``inv_alpha`` is ``1 - alpha`` (both float32).
+    Returns *None* for text with no visible glyphs.
+    """
+    from bidi.algorithm import get_display
+    from PIL import Image, ImageDraw
+
+    font = _get_font(font_size)
+    # Reorder RTL text (Hebrew/Arabic) to visual order
+    display_text = get_display(text)
+    left, top, right, bottom = font.getbbox(display_text)
+    if right <= left or bottom <= top:
+        return None
+    sprite = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).text(
+        (-left, -top), display_text, font=font, fill=(*rgb_color, 255))
+    rgba = np.asarray(sprite, dtype=np.float32)
+    alpha = rgba[:, :, 3:] / 255.0
+    # RGB → BGR, premultiplied; +0.5 rounds on the final uint8 store
+    fg = rgba[:, :, 2::-1] * alpha + 0.5
+    return left, top, fg, 1.0 - alpha
+
+
+def _scale_points(pts: np.ndarray, w: int, h: int, x_offset_px: int = 0) -> np.ndarray:
+    """Scale ``(N, 2) float32`` normalised points to ``(N, 2) int32`` pixels.
+
+    Truncates like ``int()`` did in the old per-vertex path; the optional
+    x offset is added in place on the integer result.
+    """
+    pts_px = np.multiply(pts, np.float32((w, h)), dtype=np.float32).astype(np.int32)
+    if x_offset_px:
+        pts_px[:, 0] += x_offset_px
+    return pts_px
+
+
+def _arrow_tip(p0: np.ndarray, p1: np.ndarray, tip_length: float = 0.03) -> np.ndarray:
+    """Arrow-head wing segments ``[[tip, wing], [tip, wing]]`` as ``(2, 2, 2) int32``.
+
+    Same geometry as ``cv2.arrowedLine``: two wings of
+    ``tip_length * |p1 - p0|`` at ±45° back from *p1*.
+    """
+    x0, y0 = float(p0[0]), float(p0[1])
+    x1, y1 = float(p1[0]), float(p1[1])
+    size = math.hypot(x0 - x1, y0 - y1) * tip_length
+    angle = math.atan2(y0 - y1, x0 - x1)
+    wings = [
+        (round(x1 + size * math.cos(a)), round(y1 + size * math.sin(a)))
+        for a in (angle + math.pi / 4, angle - math.pi / 4)
+    ]
+    tip = (int(x1), int(y1))
+    return np.array([[tip, wings[0]], [tip, wings[1]]], dtype=np.int32)
+
+
+@dataclass(slots=True)
+class Annotation:
+    """One annotation, parsed once from its JSON dict in :meth:`AnnotationOverlay.add`.
+
+    Pre-parsing keeps ``dict.get`` / list→tuple conversions out of the
+    render path.  ``raw`` is the original dict, returned by ``get_all``.
+    """
+    type: str
+    color: tuple[int, int, int]
+    thick: int
+    points: np.ndarray                  # (N, 2) float32, normalised 0-1
+    line_type: int = cv2.LINE_AA
+    text: str = ""
+    source_eye: str = "left"
+    raw: dict[str, Any] = field(default_factory=dict)
+    # ((w, h), (N, 2) int32 pixel coords) – see _pixel_points()
+    px_cache: tuple | None = None
+    # ((w, h), (2, 2, 2) int32 arrow-head segments) – see _arrow_tip()
+    tip_cache: tuple | None = None
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "Annotation":
+        kind = d.get("type", "freehand")
+        thick = int(d.get("width", 2))
+        # Anti-aliasing costs several times more per pixel than LINE_8
+        # and is barely visible on thick freehand strokes (the bulk of
+        # drawn pixels), so only those default to LINE_8; text, shapes
+        # and thin strokes keep it.  An explicit "aa" overrides.
+        aa = d.get("aa")
+        if aa is None:
+            aa = not (kind == "freehand" and thick >= 3)
+        return cls(
+            type=kind,
+            color=tuple(int(c) for c in d.get("color", (0, 255, 0))[:3]),
+            thick=thick,
+            points=np.asarray(d.get("points", []), dtype=np.float32).reshape(-1, 2),
+            line_type=cv2.LINE_AA if aa else cv2.LINE_8,
+            text=d.get("text", ""),
+            source_eye="left" if d.get("source_eye", "left") == "left" else "right",
+            raw=d,
+        )
+
+
 class AnnotationOverlay:
     """Thread-safe annotation store + renderer."""
 
-    def __init__(self):
-        self._annotations: list[dict[str, Any]] = []
+    # Horizontal margin (px) on each side of a cached layer, so strokes
+    # that fall just outside the source eye still appear in the other eye
+    # once shifted by the disparity offset.  Matches the web UI clamp.
+    LAYER_MARGIN: int = 400
+
+    def __init__(self, use_opencl: bool = False):
+        # Immutable snapshot of the annotation list.  Writers (Flask
+        # thread) rebuild it under ``_lock`` and swap the reference;
+        # readers (render loop) just load the reference – no locking.
+        self._snapshot: tuple[Annotation, ...] = ()
         self._lock = threading.Lock()
 
         # When True, annotations are rendered onto the Goovis display
@@ -96,31 +219,47 @@ class AnnotationOverlay:
         # Adjustable via the web UI slider.
         self.disparity_offset: int = 0
 
+        # Blend layers via OpenCL (cv2.UMat) – opt-in through
+        # ``stereo.use_opencl``.  Helps on iGPUs; on CPU-only runtimes
+        # (e.g. pocl) the per-eye upload / download costs more than the
+        # numpy blend.
+        self.use_opencl: bool = use_opencl and cv2.ocl.haveOpenCL()
+
+        # (snapshot, (w, h), layers) – see _layers()
+        self._layer_cache: tuple | None = None
+        # Background rasteriser: woken whenever the snapshot changes so
+        # the render loop only ever composites pre-built layers.
+        self._layer_size: tuple[int, int] | None = None
+        self._dirty = threading.Event()
+        self._raster_thread: threading.Thread | None = None
+
     # ------------------------------------------------------------------
     # Mutation (called from Flask thread)
     # ------------------------------------------------------------------
 
     def add(self, annotation: dict[str, Any]):
+        ann = Annotation.from_dict(annotation)
         with self._lock:
-            self._annotations.append(annotation)
+            self._snapshot = self._snapshot + (ann,)
+        self._mark_dirty()
 
     def undo(self):
         with self._lock:
-            if self._annotations:
-                self._annotations.pop()
+            if self._snapshot:
+                self._snapshot = self._snapshot[:-1]
+        self._mark_dirty()
 
     def clear(self):
         with self._lock:
-            self._annotations.clear()
+            self._snapshot = ()
+        self._mark_dirty()
 
     def get_all(self) -> list[dict[str, Any]]:
-        with self._lock:
-            return list(self._annotations)
+        return [ann.raw for ann in self._snapshot]
 
     @property
     def count(self) -> int:
-        with self._lock:
-            return len(self._annotations)
+        return len(self._snapshot)
 
     # ------------------------------------------------------------------
     # Rendering
@@ -135,30 +274,173 @@ class AnnotationOverlay:
         shifted horizontally by ``disparity_offset`` pixels so that
         markings align with the same feature in both views.
         """
-        if not self.show_on_screen:
-            return eye_l, eye_r
-
-        with self._lock:
-            annotations = list(self._annotations)
-
-        if not annotations:
+        annotations = self._snapshot  # atomic reference read, no lock
+        if not self.show_on_screen or not annotations:
             return eye_l, eye_r
 
         disp = self.disparity_offset
-
-        for ann in annotations:
-            source = ann.get("source_eye", "left")
+        h, w = eye_l.shape[:2]
+        composite = self._composite
+        m = self.LAYER_MARGIN
+
+        # Each annotation is rasterised once (per source eye) into a
+        # transparent layer, then blended into the source eye as-is and
+        # into the other eye shifted by the disparity offset.
+        for source, (bgr, inv, rect) in self._layers(annotations, w, h).items():
             if source == "left":
-                # Drawn on left → render as-is on left, shifted on right
-                self._draw_one(eye_l, ann, x_offset_px=0)
-                self._draw_one(eye_r, ann, x_offset_px=-disp)
+                # Drawn on left → as-is on left, shifted on right
+                composite(eye_l, bgr, inv, rect, -m)
+                composite(eye_r, bgr, inv, rect, -disp - m)
             else:
-                # Drawn on right → render as-is on right, shifted on left
-                self._draw_one(eye_r, ann, x_offset_px=0)
-                self._draw_one(eye_l, ann, x_offset_px=disp)
+                # Drawn on right → as-is on right, shifted on left
+                composite(eye_r, bgr, inv, rect, -m)
+                composite(eye_l, bgr, inv, rect, disp - m)
 
         return eye_l, eye_r
 
+    def _layers(
+        self, annotations: tuple[Annotation, ...], w: int, h: int
+    ) -> dict[str, tuple]:
+        """Return ``{source_eye: (bgr, inv_alpha, bounding_rect)}`` to draw.
+
+        When the snapshot has changed since the cached layers were built,
+        rasterisation is handed to the background thread and the previous
+        layers are returned meanwhile (a one-frame lag is imperceptible).
+        Only the first build for a given eye size runs synchronously.
+        """
+        cached = self._layer_cache
+        if cached is not None and cached[1] == (w, h):
+            if cached[0] is not annotations:
+                self._request_layers(w, h)
+            return cached[2]
+        self._layer_size = (w, h)
+        return self._build_layers(annotations, w, h)
+
+    def _mark_dirty(self):
+        if self._raster_thread is not None:
+            self._dirty.set()
+
+    def _request_layers(self, w: int, h: int):
+        self._layer_size = (w, h)
+        if self._raster_thread is None:
+            self._raster_thread = threading.Thread(
+                target=self._raster_loop, daemon=True, name="annotation-raster"
+            )
+            self._raster_thread.start()
+        self._dirty.set()
+
+    def _raster_loop(self):
+        """Rebuild layers in the background whenever the snapshot changes."""
+        while True:
+            self._dirty.wait()
+            self._dirty.clear()
+            annotations = self._snapshot
+            w, h = self._layer_size
+            cached = self._layer_cache
+            if cached is None or cached[0] is not annotations or cached[1] != (w, h):
+                self._build_layers(annotations, w, h)
+
+    def _build_layers(
+        self, annotations: tuple[Annotation, ...], w: int, h: int
+    ) -> dict[str, tuple]:
+        """Rasterise *annotations* into per-source-eye layers and cache them.
+
+        Layers are premultiplied BGRA images the size of one eye plus
+        ``LAYER_MARGIN`` on either side.  They depend only on the snapshot
+        and the eye size (not the disparity offset).  The cache is
+        published as a single tuple so concurrent readers (main loop,
+        stream threads) never see a half-built entry.
+        """
+        groups: dict[str, list[Annotation]] = {}
+        for ann in annotations:
+            groups.setdefault(ann.source_eye, []).append(ann)
+
+        layers = {}
+        m = self.LAYER_MARGIN
+        for source, anns in groups.items():
+            layer = np.zeros((h, w + 2 * m, 4), dtype=np.uint8)
+            texts = []
+            # Consecutive freehand / line strokes sharing colour + width
+            # are batched into a single cv2.polylines call (consecutive
+            # only, so drawing order is preserved).
+            run_key: tuple | None = None
+            run: list[np.ndarray] = []
+            for ann in anns:
+                # Normalised → pixel conversion is done once per annotation
+                # (and cached) rather than once per vertex per eye.
+                pts_px = self._pixel_points(ann, w, h)
+                atype = ann.type
+                if atype in ("freehand", "line") and len(pts_px) >= 2:
+                    key = (ann.color, ann.thick, ann.line_type)
+                    if key != run_key:
+                        self._draw_strokes(layer, run_key, run)
+                        run_key, run = key, []
+                    stroke = pts_px if atype == "freehand" else pts_px[[0, -1]]
+                    stroke = stroke + np.int32((m, 0))
+                    run.append(stroke)
+                    continue
+                self._draw_strokes(layer, run_key, run)
+                run_key, run = None, []
+                if atype == "text":
+                    texts.append((ann, pts_px, m))
+                else:
+                    self._draw_one(layer, ann, x_offset_px=m, pts_px=pts_px)
+            self._draw_strokes(layer, run_key, run)
+            if texts:
+                self._draw_texts(layer, texts)
+            rect = cv2.boundingRect(np.ascontiguousarray(layer[:, :, 3]))
+            if rect[2] > 0 and rect[3] > 0:
+                # Split into the two planes the blend needs, once per build
+                bgr = np.ascontiguousarray(layer[:, :, :3])
+                inv_alpha = cv2.cvtColor(255 - layer[:, :, 3], cv2.COLOR_GRAY2BGR)
+                if self.use_opencl:
+                    bgr, inv_alpha = cv2.UMat(bgr), cv2.UMat(inv_alpha)
+                layers[source] = (bgr, inv_alpha, rect)
+
+        self._layer_cache = (annotations, (w, h), layers)
+        return layers
+
+    @staticmethod
+    def _draw_strokes(layer: np.ndarray, key: tuple | None, strokes: list[np.ndarray]):
+        """Draw a run of open polylines sharing ``key = (color, width, line_type)``."""
+        if not strokes:
+            return
+        color, thick, line_type = key
+        cv2.polylines(layer, strokes, False, (*color, 255), thick, line_type)
+
+    @staticmethod
+    def _composite(dst: np.ndarray, bgr: np.ndarray | cv2.UMat,
+                   inv_alpha: np.ndarray | cv2.UMat,
+                   rect: tuple[int, int, int, int], x_shift: int):
+        """Alpha-blend a premultiplied layer (*bgr*, ``255 - alpha``) into *dst*.
+
+        Only the layer's bounding *rect* is touched, shifted right by
+        *x_shift* pixels (negative = left) and clipped to the frame.
+        ``cv2.UMat`` planes run the blend through OpenCL (T-API).
+        """
+        x, y, rw, rh = rect
+        w = dst.shape[1]
+        x0 = max(x + x_shift, 0)
+        x1 = min(x + rw + x_shift, w)
+        if x1 <= x0:
+            return
+        rows = (y, y + rh)
+        cols = (x0 - x_shift, x1 - x_shift)
+        roi = dst[y:y + rh, x0:x1]
+        if isinstance(bgr, cv2.UMat):
+            blended = cv2.add(
+                cv2.multiply(cv2.UMat(np.ascontiguousarray(roi)),
+                             cv2.UMat(inv_alpha, rows, cols), scale=1 / 255.0),
+                cv2.UMat(bgr, rows, cols),
+            ).get()
+        else:
+            blended = cv2.add(
+                cv2.multiply(roi, inv_alpha[slice(*rows), slice(*cols)],
+                             scale=1 / 255.0),
+                bgr[slice(*rows), slice(*cols)],
+            )
+        roi[:] = blended
+
     def render_on_sbs(self, sbs: np.ndarray) -> np.ndarray:
         """Draw all annotations onto the SBS (side-by-side) image in-place.
         This is used for the 'Annotated' stream/tab, so placement is correct in 3D context.
@@ -175,30 +457,18 @@ class AnnotationOverlay:
         # Simple average for fusion (could use more advanced fusion if needed)
         fused = ((eye_l.astype(np.float32) + eye_r.astype(np.float32)) / 2).astype(np.uint8)
         h, w = fused.shape[:2]
-        with self._lock:
-            annotations = list(self._annotations)
+        annotations = self._snapshot
         if not annotations:
             return fused
         disp = self.disparity_offset
         for ann in annotations:
-            pts = ann.get("points", [])
-            # Average the x disparity for fused placement
-            fused_pts = []
-            for pt in pts:
-                # pt is normalized [0,1] in single-eye
-                x = pt[0]
-                y = pt[1]
-                # If annotation is from left, right is shifted by -disp; if from right, left is shifted by +disp
-                source = ann.get("source_eye", "left")
-                if source == "left":
-                    x_r = x - disp / w
-                    x_fused = (x + x_r) / 2
-                else:
-                    x_l = x + disp / w
-                    x_fused = (x + x_l) / 2
-                fused_pts.append([x_fused, y])
-            ann_fused = ann.copy()
-            ann_fused["points"] = fused_pts
+            # Average the x disparity for fused placement: if annotation
+            # is from left, right is shifted by -disp; if from right, left
+            # is shifted by +disp.  Either way the fused x moves by half.
+            half = (-disp if ann.source_eye == "left" else disp) / w / 2
+            fused_pts = ann.points + np.float32((half, 0.0))
+            ann_fused = replace(ann, points=fused_pts, px_cache=None,
+                                tip_cache=None)
             self._draw_one(fused, ann_fused, x_offset_px=0)
         return fused
 
@@ -207,54 +477,118 @@ class AnnotationOverlay:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _draw_one(img: np.ndarray, ann: dict, x_offset_px: int = 0):
+    def _pixel_points(ann: Annotation, w: int, h: int) -> np.ndarray:
+        """Normalised [0-1] points → ``(N, 2) int32`` pixel coords.
+
+        The result is cached on the annotation keyed by the frame size,
+        so long freehand strokes are converted once instead of once per
+        vertex, per eye, per frame.
+        """
+        cached = ann.px_cache
+        if cached is not None and cached[0] == (w, h):
+            return cached[1]
+        pts_px = _scale_points(ann.points, w, h)
+        ann.px_cache = ((w, h), pts_px)
+        return pts_px
+
+    @staticmethod
+    def _draw_one(img: np.ndarray, ann: Annotation, x_offset_px: int = 0,
+                  pts_px: np.ndarray | None = None):
         h, w = img.shape[:2]
-        color = tuple(ann.get("color", [0, 255, 0]))
-        thick = ann.get("width", 2)
-        atype = ann.get("type", "freehand")
-        pts = ann.get("points", [])
+        color = ann.color
+        if img.shape[2] == 4:
+            color = (*color, 255)   # opaque on a transparent layer
+        thick = ann.thick
+        atype = ann.type
+        if pts_px is None:
+            pts_px = AnnotationOverlay._pixel_points(ann, w, h)
+        pts = pts_px + np.int32((x_offset_px, 0)) if x_offset_px else pts_px
+        lt = ann.line_type
 
         def px(pt):
-            """Normalised [0-1] → pixel coords, with optional x offset."""
-            return int(pt[0] * w) + x_offset_px, int(pt[1] * h)
+            """Pixel-coord row → ``(x, y)`` tuple for cv2."""
+            return int(pt[0]), int(pt[1])
 
         if atype == "freehand" and len(pts) >= 2:
-            for i in range(len(pts) - 1):
-                cv2.line(img, px(pts[i]), px(pts[i + 1]), color, thick, cv2.LINE_AA)
+            # One C call for the whole stroke instead of one per segment
+            cv2.polylines(img, [pts], False, color, thick, lt)
 
         elif atype == "line" and len(pts) >= 2:
-            cv2.line(img, px(pts[0]), px(pts[-1]), color, thick, cv2.LINE_AA)
+            cv2.line(img, px(pts[0]), px(pts[-1]), color, thick, lt)
 
         elif atype == "arrow" and len(pts) >= 2:
-            cv2.arrowedLine(img, px(pts[0]), px(pts[-1]), color, thick,
-                            cv2.LINE_AA, tipLength=0.03)
+            # Head geometry is cached per frame size, so layer rebuilds
+            # skip arrowedLine's trig for arrows that haven't changed.
+            cached = ann.tip_cache
+            if cached is None or cached[0] != (w, h):
+                cached = ann.tip_cache = ((w, h), _arrow_tip(pts_px[0], pts_px[-1]))
+            wings = cached[1] + np.int32((x_offset_px, 0)) if x_offset_px else cached[1]
+            # Shaft and both wings as separate open segments in one call
+            # (a joined 3-point head would render AA joins differently).
+            cv2.polylines(img, [pts[[0, -1]], wings[0], wings[1]], False,
+                          color, thick, lt)
 
         elif atype == "circle" and len(pts) >= 2:
             cx, cy = px(pts[0])
             ex, ey = px(pts[-1])
             radius = int(math.hypot(ex - cx, ey - cy))
-            cv2.circle(img, (cx, cy), radius, color, thick, cv2.LINE_AA)
+            cv2.circle(img, (cx, cy), radius, color, thick, lt)
 
         elif atype == "rect" and len(pts) >= 2:
-            cv2.rectangle(img, px(pts[0]), px(pts[-1]), color, thick, cv2.LINE_AA)
-
-        elif atype == "text" and len(pts) >= 1:
-            text = ann.get("text", "")
-            if text:
-                x, y = px(pts[0])
-                # Scale font to frame height so text is readable on 1080p
-                # Base: ~32px at 1080p, scaling with the width slider
-                base_size = max(24, int(h * 0.03))
-                font_size = base_size + (thick - 1) * 4
-                font = _get_font(font_size)
-
-                # Reorder RTL text (Hebrew/Arabic) to visual order
-                display_text = get_display(text)
-
-                # Render with Pillow (supports Unicode / Hebrew / Arabic)
-                pil_img = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-                draw = ImageDraw.Draw(pil_img)
-                # color is BGR tuple → convert to RGB for Pillow
-                rgb_color = (color[2], color[1], color[0])
-                draw.text((x, y - font_size), display_text, font=font, fill=rgb_color)
-                cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR, dst=img)
+            cv2.rectangle(img, px(pts[0]), px(pts[-1]), color, thick, lt)
+
+        elif atype == "text":
+            AnnotationOverlay._draw_texts(img, [(ann, pts_px, x_offset_px)])
+
+    @staticmethod
+    def _draw_texts(img: np.ndarray, items: list[tuple[Annotation, np.ndarray, int]]):
+        """Draw a batch of ``(ann, pts_px, x_offset_px)`` text annotations.
+
+        Pillow is used for Unicode / Hebrew / Arabic support.  Each
+        ``(text, font size, colour)`` is rasterised once into a cached
+        sprite (see :func:`_text_sprite`) and alpha-blended straight into
+        the BGR frame, so steady-state frames never touch Pillow.
+        Without Pillow / python-bidi, ``cv2.putText`` is used instead.
+        """
+        h, w = img.shape[:2]
+        # Scale font to frame height so text is readable on 1080p
+        # Base: ~32px at 1080p, scaling with the width slider
+        base_size = max(24, int(h * 0.03))
+
+        for ann, pts_px, x_offset_px in items:
+            text = ann.text
+            if not text or len(pts_px) < 1:
+                continue
+            color = ann.color
+            font_size = base_size + (ann.thick - 1) * 4
+            if not _PIL_AVAILABLE:
+                bgr = (*color, 255) if img.shape[2] == 4 else color
+                cv2.putText(img, text,
+                            (int(pts_px[0, 0]) + x_offset_px, int(pts_px[0, 1])),
+                            cv2.FONT_HERSHEY_SIMPLEX, font_size / 30.0, bgr,
+                            max(1, ann.thick // 2), ann.line_type)
+                continue
+            # color is BGR → convert to RGB for Pillow
+            rgb_color = (color[2], color[1], color[0])
+            sprite = _text_sprite(text, font_size, rgb_color)
+            if sprite is None:
+                continue
+            dx, dy, fg, inv_alpha = sprite
+
+            # Text origin sits font_size above the anchor point
+            x0 = int(pts_px[0, 0]) + x_offset_px + dx
+            y0 = int(pts_px[0, 1]) - font_size + dy
+            sh, sw = fg.shape[:2]
+            # Clip the sprite against the frame
+            cx0, cy0 = max(x0, 0), max(y0, 0)
+            cx1, cy1 = min(x0 + sw, w), min(y0 + sh, h)
+            if cx1 <= cx0 or cy1 <= cy0:
+                continue
+            sy = slice(cy0 - y0, cy1 - y0)
+            sx = slice(cx0 - x0, cx1 - x0)
+            roi = img[cy0:cy1, cx0:cx1]
+            inv_a = inv_alpha[sy, sx]
+            roi[:, :, :3] = roi[:, :, :3] * inv_a + fg[sy, sx]
+            if roi.shape[2] == 4:
+                # Transparent layer: accumulate coverage in the alpha channel
+                roi[:, :, 3:] = roi[:, :, 3:] * inv_a + (255.5 - 255.0 * inv_a)
@@ -17,26 +17,34 @@ Lifecycle
 
 from __future__ import annotations
 
+import functools
+import os
 import sys
+import threading
 import time
-from collections import deque
 
 import cv2
 import numpy as np
 
 from .config import PiccoloCfg
-from .camera import CameraCapture, TestPatternCamera
+from .camera import (CameraCapture, ProcessCameraCapture, TestPatternCamera,
+                     allowed_cpus, pin_current_thread, wait_any)
 from .stereo_processor import StereoProcessor
 from .stereo_align import StereoAligner
 from .calibration import CalibrationOverlay
 from .display import StereoDisplay
 from .input_handler import InputHandler, Action
 from .viewer_stream import ViewerStream
+from .text_sprite import put_text
 
 
 class PiccoloApp:
     """Top-level application object."""
 
+    # Refresh periods (s) for the HUD text and the web UI status push
+    HUD_INTERVAL: float = 0.1
+    STATUS_INTERVAL: float = 0.1
+
     def __init__(self, cfg: PiccoloCfg):
         self.cfg = cfg
 
@@ -46,6 +54,8 @@ class PiccoloApp:
         # Components
         self.cam_l: CameraCapture | TestPatternCamera | None = None
         self.cam_r: CameraCapture | TestPatternCamera | None = None
+        # Core reserved for the stream encoder thread (cameras.pin_threads)
+        self.encoder_cpu: int | None = None
         self.processor = StereoProcessor(cfg.stereo, eye_w, eye_h)
         self.aligner = StereoAligner(
             cfg.stereo.alignment,
@@ -58,10 +68,39 @@ class PiccoloApp:
         self.stream = ViewerStream(cfg.stream, self) if cfg.stream.enabled else None
 
         self._running = False
+        self._action_handlers = self._build_action_handlers()
+        # Woken by either camera delivering a frame or a web command
+        self._wake = threading.Event()
+        if self.stream:
+            self.stream.wake = self._wake
 
         # Timing / diagnostics
-        self._fps_hist: deque[float] = deque(maxlen=60)
+        # Last 60 render-to-render intervals in a ring with a running
+        # sum – O(1) average for the FPS readout
+        self._dt_ring = np.zeros(60, dtype=np.float64)
+        self._dt_i: int = 0
+        self._dt_n: int = 0
+        self._dt_sum: float = 0.0
         self._loop_time: float = 0.0
+        self._last_render_t: float | None = None
+        self._next_hud_t: float = 0.0
+        self._next_status_t: float = 0.0
+        self._hud_items: list[tuple] = []
+        # Status template for the web UI, mutated in place by _push_status()
+        self._status: dict = {
+            "fps": 0.0, "loop_ms": 0.0, "zoom": 1.0, "convergence_offset": 0,
+            "alignment": {
+                "enabled": False, "method": "", "dy": 0.0, "dtheta_deg": 0.0,
+                "n_matches": 0, "confidence": 0.0, "rms_residual": 0.0,
+                "converged": False,
+            },
+            "calibration": False, "calibration_phase": "off",
+            "nudge_left": 0, "nudge_right": 0,
+            "nudge_left_y": 0, "nudge_right_y": 0,
+            "annotations": {
+                "count": 0, "show_on_screen": False, "disparity_offset": 0,
+            },
+        }
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -96,27 +135,62 @@ class PiccoloApp:
             self.cam_r = TestPatternCamera(ccfg.right.width, ccfg.right.height, side="right", name="test-R").start()
         else:
             print(f"[piccolo] Opening cameras (backend={ccfg.backend})…")
-            self.cam_l = CameraCapture(
+            cpu_l = cpu_r = None
+            main_cpus: list[int] = []
+            if ccfg.pin_threads:
+                # Only ever pick from the cores we were given.  With enough
+                # of them each grab thread gets its own (the first is left
+                # to the OS / main loop), and with five or more the stream
+                # encoder gets one too.
+                cpus = allowed_cpus()
+                if len(cpus) >= 4:
+                    cpu_l, cpu_r = cpus[1], cpus[2]
+                    main_cpus = [c for c in cpus if c not in (cpu_l, cpu_r)]
+                    if len(main_cpus) >= 3:
+                        self.encoder_cpu = main_cpus.pop()
+            cam_cls = CameraCapture
+            if ccfg.grab_process and ccfg.backend != "picamera2":
+                cam_cls = ProcessCameraCapture
+            self.cam_l = cam_cls(
                 ccfg.left.index, ccfg.left.width, ccfg.left.height,
-                backend=ccfg.backend, name="cam-L"
+                backend=ccfg.backend, name="cam-L", low_latency=ccfg.low_latency,
+                cpu=cpu_l, max_decode_fps=ccfg.max_decode_fps,
+                raw_mjpeg=ccfg.raw_mjpeg,
             ).start()
-            self.cam_r = CameraCapture(
+            self.cam_r = cam_cls(
                 ccfg.right.index, ccfg.right.width, ccfg.right.height,
-                backend=ccfg.backend, name="cam-R"
+                backend=ccfg.backend, name="cam-R", low_latency=ccfg.low_latency,
+                cpu=cpu_r, max_decode_fps=ccfg.max_decode_fps,
+                raw_mjpeg=ccfg.raw_mjpeg,
             ).start()
+            if cpu_l is not None:
+                # Keep the render loop (and threads it starts later) off
+                # the grab cores so producer and consumer don't share L1/L2
+                pin_current_thread(main_cpus)
 
     def _main_loop(self):
+        cams = (self.cam_l, self.cam_r)
+        # Upper bound on the idle sleep so keyboard input stays responsive
+        idle_timeout = 1.0 / 120
         while self._running:
+            # 0 ─ Sleep until a camera has a new frame or a web command
+            #     arrives (instead of re-rendering the same frame)
+            new_frame = wait_any(cams, idle_timeout, self._wake)
+            # loop_ms measures the work only, not the idle wait above
             t0 = time.perf_counter()
 
             # 1 ─ Input (keyboard + web UI)
             actions = self.input.poll()
-            if self.stream:
+            had_cmds = bool(self.stream) and self.stream.has_commands
+            if had_cmds:
                 for cmd in self.stream.drain_commands():
                     self._handle_web_command(cmd)
             self._handle_actions(actions)
             if not self._running:
                 break
+            # Nothing new to show – skip the stereo / display path
+            if not (new_frame or actions or had_cmds):
+                continue
 
             # 2 ─ Grab latest frames (zero-copy – no memcpy)
             frame_l = self.cam_l.read_no_copy()
@@ -134,28 +208,32 @@ class PiccoloApp:
             # 2d ─ Auto-align: correct vertical misalignment & rotation
             #      between cameras (periodic re-estimation + per-frame warp)
             if self.aligner.needs_update():
+                # update() holds the frames for tens of ms – longer than
+                # the capture pool keeps a read_no_copy() view intact – so
+                # work on private copies or the warp below can read a
+                # half-overwritten slot.
+                frame_l, frame_r = frame_l.copy(), frame_r.copy()
                 self.aligner.update(frame_l, frame_r)
-            frame_l, frame_r = self.aligner.warp_pair(frame_l, frame_r)
+            warp_l, warp_r = self.aligner.get_affines()
 
             # 3 ─ Stereo processing (zoom + convergence) → writes into
-            #     pre-allocated SBS buffer to avoid allocation every frame
-            # Use joint zoom center if set
-            if hasattr(self.processor, 'joint_zoom_center'):
+            #     pre-allocated SBS buffer to avoid allocation every frame.
+            #     With an alignment correction, align + zoom are fused
+            #     into one warpAffine per eye.
+            if warp_l is not None:
+                eye_l, eye_r, sbs = self.processor.process_pair_affine(
+                    frame_l, frame_r, warp_l, warp_r, self.aligner.overlap_mask)
+            elif hasattr(self.processor, 'joint_zoom_center'):
+                # Use joint zoom center if set
                 eye_l, eye_r, sbs = self.processor.process_pair_joint_zoom(frame_l, frame_r)
             else:
                 eye_l, eye_r, sbs = self.processor.process_pair(frame_l, frame_r)
 
-            # 4a ─ Apply persistent per-eye nudge offsets (always)
-            eye_l, eye_r = self.calibration.apply_nudge(eye_l, eye_r)
-
-            # 4b ─ Calibration overlay (only when calibrating)
-            if self.calibration.active:
-                eye_l, eye_r = self.calibration.apply(eye_l, eye_r)
-
-            # Write back into the SBS buffer (nudge always, overlay when active)
-            if self.calibration.active or self.calibration.nudge_left != 0 or self.calibration.nudge_right != 0:
-                sbs[:, :self.processor.eye_w] = eye_l
-                sbs[:, self.processor.eye_w:] = eye_r
+            # 4 ─ Persistent per-eye nudge offsets (always) + calibration
+            #     overlay (only when calibrating).  The eyes are views into
+            #     ``sbs``, so both land in it directly.
+            if self.calibration.needs_processing:
+                eye_l, eye_r = self.calibration.process(eye_l, eye_r)
 
             # 5 ─ Push CLEAN frames to viewer stream BEFORE annotations
             #     so the web annotation page shows un-annotated video
@@ -163,89 +241,111 @@ class PiccoloApp:
             if self.stream:
                 self.stream.update_frame(sbs=sbs, left=eye_l, right=eye_r)
 
-            # 6 ─ Annotation overlay (Goovis display only)
+            # 6 ─ Annotation overlay (Goovis display only) – drawn in
+            #     place on the eye views, i.e. straight into ``sbs``
             if self.stream and self.stream.annotations.show_on_screen:
                 self.stream.annotations.render(eye_l, eye_r)
-                sbs[:, :self.processor.eye_w] = eye_l
-                sbs[:, self.processor.eye_w:] = eye_r
 
             # 7 ─ Draw HUD (zoom level + FPS)
-            sbs = self._draw_hud(sbs)
+            sbs = self._draw_hud(sbs, t0)
 
             # 8 ─ Display (pre-allocated surface, zero-alloc blit)
             pedal_mode = self.input.get_pedal_mode()
             self.display.show(sbs, pedal_mode=pedal_mode)
             self.display.tick()
 
-            # 9 ─ Push status to web UI
-            if self.stream:
+            # 9 ─ Push status to web UI (throttled – humans read it)
+            if self.stream and t0 >= self._next_status_t:
+                self._next_status_t = t0 + self.STATUS_INTERVAL
                 self._push_status()
 
-            # Track frame timing
-            dt = time.perf_counter() - t0
-            self._loop_time = dt
-            self._fps_hist.append(dt)
+            # Track frame timing: loop_ms is this frame's processing time,
+            # FPS comes from the interval between rendered frames
+            t1 = time.perf_counter()
+            self._loop_time = t1 - t0
+            last, self._last_render_t = self._last_render_t, t1
+            if last is None:
+                continue
+            dt = t1 - last
+            self._dt_sum += dt - self._dt_ring[self._dt_i]
+            self._dt_ring[self._dt_i] = dt
+            self._dt_i = (self._dt_i + 1) % len(self._dt_ring)
+            if self._dt_n < len(self._dt_ring):
+                self._dt_n += 1
+
+    def _build_action_handlers(self) -> dict:
+        """Map each :class:`Action` to the callable that performs it."""
+        proc, cal = self.processor, self.calibration
+        return {
+            Action.QUIT: self._act_quit,
+            Action.ZOOM_IN: proc.zoom_in,
+            Action.ZOOM_OUT: proc.zoom_out,
+            Action.CONVERGE_IN: proc.converge_in,
+            Action.CONVERGE_OUT: proc.converge_out,
+            Action.TOGGLE_CALIBRATION: self._act_toggle_calibration,
+            Action.CALIB_NEXT: self._act_calib_next,
+            Action.CALIB_NUDGE_LEFT: cal.nudge_current_left,
+            Action.CALIB_NUDGE_RIGHT: cal.nudge_current_right,
+            Action.TOGGLE_ALIGNMENT: self._act_toggle_alignment,
+            Action.RESET: self._act_reset,
+            Action.PEDAL_ZOOM_IN: proc.zoom_in,
+            Action.PEDAL_ZOOM_OUT: proc.zoom_out,
+            Action.PEDAL_CENTER_LEFT: functools.partial(self._act_pan, -1, 0),
+            Action.PEDAL_CENTER_RIGHT: functools.partial(self._act_pan, 1, 0),
+            Action.PEDAL_CENTER_UP: functools.partial(self._act_pan, 0, -1),
+            Action.PEDAL_CENTER_DOWN: functools.partial(self._act_pan, 0, 1),
+        }
 
     def _handle_actions(self, actions: set):
-        if Action.QUIT in actions:
-            self._running = False
-        if Action.ZOOM_IN in actions:
-            self.processor.zoom_in()
-        if Action.ZOOM_OUT in actions:
-            self.processor.zoom_out()
-        if Action.CONVERGE_IN in actions:
-            self.processor.converge_in()
-        if Action.CONVERGE_OUT in actions:
-            self.processor.converge_out()
-        if Action.TOGGLE_CALIBRATION in actions:
-            was_active = self.calibration.active
-            self.calibration.toggle()
-            print(f"[piccolo] Calibration {'ON' if self.calibration.active else 'OFF'}")
-            # Trigger fresh alignment when calibration exits
-            if was_active and not self.calibration.active and self.aligner.enabled:
-                self.aligner.force_update()
-                print("[piccolo] Post-calibration alignment triggered.")
-        if Action.CALIB_NEXT in actions:
-            was_active = self.calibration.active
-            self.calibration.next_phase()
-            phase = self.calibration.phase
-            print(f"[piccolo] Calibration phase → {phase}")
-            # If next_phase caused exit, trigger re-alignment
-            if was_active and not self.calibration.active and self.aligner.enabled:
-                self.aligner.force_update()
-                print("[piccolo] Post-calibration alignment triggered.")
-        if Action.CALIB_NUDGE_LEFT in actions:
-            self.calibration.nudge_current_left()
-        if Action.CALIB_NUDGE_RIGHT in actions:
-            self.calibration.nudge_current_right()
-        if Action.TOGGLE_ALIGNMENT in actions:
-            self.aligner.enabled = not self.aligner.enabled
-            state = "ON" if self.aligner.enabled else "OFF"
-            print(f"[piccolo] Auto-alignment {state}")
-            if self.aligner.enabled:
-                self.aligner.force_update()  # re-estimate immediately
-        if Action.RESET in actions:
-            self.processor.reset()
-            self.aligner.reset()
-            self.calibration.reset_nudge()
-            print("[piccolo] Reset zoom, convergence, alignment & nudge.")
-
-        if Action.PEDAL_ZOOM_IN in actions:
-            self.processor.zoom_in()
-        if Action.PEDAL_ZOOM_OUT in actions:
-            self.processor.zoom_out()
-        if Action.PEDAL_CENTER_LEFT in actions:
-            if hasattr(self.processor, 'joint_zoom_center'):
-                self.processor.set_joint_zoom_center(self.processor.joint_zoom_center - 1)
-        if Action.PEDAL_CENTER_RIGHT in actions:
-            if hasattr(self.processor, 'joint_zoom_center'):
-                self.processor.set_joint_zoom_center(self.processor.joint_zoom_center + 1)
-        if Action.PEDAL_CENTER_UP in actions:
-            if hasattr(self.processor, 'joint_zoom_center_y'):
-                self.processor.set_joint_zoom_center_y(self.processor.joint_zoom_center_y - 1)
-        if Action.PEDAL_CENTER_DOWN in actions:
-            if hasattr(self.processor, 'joint_zoom_center_y'):
-                self.processor.set_joint_zoom_center_y(self.processor.joint_zoom_center_y + 1)
+        # Iterate what happened rather than testing every Action – the
+        # common empty set costs nothing.
+        handlers = self._action_handlers
+        for action in actions:
+            handler = handlers.get(action)
+            if handler is not None:
+                handler()
+
+    def _act_quit(self):
+        self._running = False
+
+    def _act_toggle_calibration(self):
+        was_active = self.calibration.active
+        self.calibration.toggle()
+        print(f"[piccolo] Calibration {'ON' if self.calibration.active else 'OFF'}")
+        # Trigger fresh alignment when calibration exits
+        if was_active and not self.calibration.active and self.aligner.enabled:
+            self.aligner.force_update()
+            print("[piccolo] Post-calibration alignment triggered.")
+
+    def _act_calib_next(self):
+        was_active = self.calibration.active
+        self.calibration.next_phase()
+        phase = self.calibration.phase
+        print(f"[piccolo] Calibration phase → {phase}")
+        # If next_phase caused exit, trigger re-alignment
+        if was_active and not self.calibration.active and self.aligner.enabled:
+            self.aligner.force_update()
+            print("[piccolo] Post-calibration alignment triggered.")
+
+    def _act_toggle_alignment(self):
+        self.aligner.enabled = not self.aligner.enabled
+        state = "ON" if self.aligner.enabled else "OFF"
+        print(f"[piccolo] Auto-alignment {state}")
+        if self.aligner.enabled:
+            self.aligner.force_update()  # re-estimate immediately
+
+    def _act_reset(self):
+        self.processor.reset()
+        self.aligner.reset()
+        self.calibration.reset_nudge()
+        print("[piccolo] Reset zoom, convergence, alignment & nudge.")
+
+    def _act_pan(self, dx: int, dy: int):
+        """Move the joint zoom centre by ``(dx, dy)`` percent."""
+        if dx and hasattr(self.processor, 'joint_zoom_center'):
+            self.processor.set_joint_zoom_center(self.processor.joint_zoom_center + dx)
+        if dy and hasattr(self.processor, 'joint_zoom_center_y'):
+            self.processor.set_joint_zoom_center_y(self.processor.joint_zoom_center_y + dy)
 
     def _handle_web_command(self, cmd: str):
         """Translate a web UI command string into an action."""
@@ -273,59 +373,66 @@ class PiccoloApp:
             print("[piccolo] Nudge offsets reset.")
 
     def _push_status(self):
-        """Push current state to the viewer stream for the web UI."""
+        """Push current state to the viewer stream for the web UI.
+
+        ``self._status`` is a persistent template updated in place, so
+        no dicts are built per push; the stream keeps the same reference.
+        """
         ar = self.aligner.result
-        avg_dt = (sum(self._fps_hist) / len(self._fps_hist)) if self._fps_hist else 0.016
-        fps = 1.0 / avg_dt if avg_dt > 0 else 0
-        self.stream.update_status({
-            "fps": fps,
-            "loop_ms": self._loop_time * 1000,
-            "zoom": self.processor.zoom,
-            "convergence_offset": self.processor.base_offset,
-            "alignment": {
-                "enabled": self.aligner.enabled,
-                "method": ar.method,
-                "dy": ar.dy,
-                "dtheta_deg": ar.dtheta * 57.2958,
-                "n_matches": ar.n_matches,
-                "confidence": ar.confidence,
-                "rms_residual": ar.rms_residual,
-                "converged": self.aligner.converged,
-            },
-            "calibration": self.calibration.active,
-            "calibration_phase": self.calibration.phase,
-            "nudge_left": self.calibration.nudge_left,
-            "nudge_right": self.calibration.nudge_right,
-            "nudge_left_y": self.calibration.nudge_left_y,
-            "nudge_right_y": self.calibration.nudge_right_y,
-            "annotations": {
-                "count": self.stream.annotations.count,
-                "show_on_screen": self.stream.annotations.show_on_screen,
-                "disparity_offset": self.stream.annotations.disparity_offset,
-            },
-        })
+        cal = self.calibration
+        ann = self.stream.annotations
+        avg_dt = self._dt_sum / self._dt_n if self._dt_n else 0.016
+        st = self._status
+        st["fps"] = 1.0 / avg_dt if avg_dt > 0 else 0
+        st["loop_ms"] = self._loop_time * 1000
+        st["zoom"] = self.processor.zoom
+        st["convergence_offset"] = self.processor.base_offset
+        al = st["alignment"]
+        al["enabled"] = self.aligner.enabled
+        al["method"] = ar.method
+        al["dy"] = ar.dy
+        al["dtheta_deg"] = ar.dtheta * 57.2958
+        al["n_matches"] = ar.n_matches
+        al["confidence"] = ar.confidence
+        al["rms_residual"] = ar.rms_residual
+        al["converged"] = self.aligner.converged
+        st["calibration"] = cal.active
+        st["calibration_phase"] = cal.phase
+        st["nudge_left"] = cal.nudge_left
+        st["nudge_right"] = cal.nudge_right
+        st["nudge_left_y"] = cal.nudge_left_y
+        st["nudge_right_y"] = cal.nudge_right_y
+        an = st["annotations"]
+        an["count"] = ann.count
+        an["show_on_screen"] = ann.show_on_screen
+        an["disparity_offset"] = ann.disparity_offset
+        self.stream.update_status(st)
+
+    def _draw_hud(self, sbs: np.ndarray, now: float) -> np.ndarray:
+        """Minimal heads-up display: zoom level + FPS/latency + alignment.
+
+        The HUD strings are rebuilt at most every ``HUD_INTERVAL``
+        seconds; in between the cached sprites are just re-blitted.
+        """
+        if now >= self._next_hud_t:
+            self._next_hud_t = now + self.HUD_INTERVAL
+            self._hud_items = self._build_hud_items(*sbs.shape[:2])
+        for text, org, scale, color in self._hud_items:
+            put_text(sbs, text, org, scale, color)
+        return sbs
 
-    def _draw_hud(self, sbs: np.ndarray) -> np.ndarray:
-        """Minimal heads-up display: zoom level + FPS/latency + alignment."""
-        h, w = sbs.shape[:2]
+    def _build_hud_items(self, h: int, w: int) -> list[tuple]:
+        """Return ``[(text, org, scale, color), ...]`` for the current state."""
+        items = []
         z = self.processor.zoom
         if z > 1.001:
-            text = f"ZOOM {z:.1f}x"
-            cv2.putText(
-                sbs, text,
-                (w // 2 - 60, h - 20),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 220, 0), 1, cv2.LINE_AA,
-            )
+            items.append((f"ZOOM {z:.1f}x", (w // 2 - 60, h - 20), 0.6, (0, 220, 0)))
         # FPS / loop-time indicator (top-left, small)
-        if self._fps_hist:
-            avg_dt = sum(self._fps_hist) / len(self._fps_hist)
+        if self._dt_n:
+            avg_dt = self._dt_sum / self._dt_n
             fps = 1.0 / avg_dt if avg_dt > 0 else 0
             ms = self._loop_time * 1000
-            cv2.putText(
-                sbs, f"{fps:.0f}fps  {ms:.1f}ms",
-                (8, 22),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 180, 0), 1, cv2.LINE_AA,
-            )
+            items.append((f"{fps:.0f}fps  {ms:.1f}ms", (8, 22), 0.5, (0, 180, 0)))
         # Alignment status (top-right area)
         ar = self.aligner.result
         if self.aligner.enabled:
@@ -341,12 +448,8 @@ class PiccoloApp:
         else:
             align_txt = "ALIGN off"
             color = (100, 100, 100)
-        cv2.putText(
-            sbs, align_txt,
-            (w - 420, 22),
-            cv2.FONT_HERSHEY_SIMPLEX, 0.45, color, 1, cv2.LINE_AA,
-        )
-        return sbs
+        items.append((align_txt, (w - 420, 22), 0.45, color))
+        return items
 
     def _shutdown(self):
         print("[piccolo] Shutting down…")
@@ -34,6 +34,11 @@ import cv2
 import numpy as np
 
 from .config import CalibrationCfg
+from .text_sprite import put_text
+
+
+def _passthrough(eye_l: np.ndarray, eye_r: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return eye_l, eye_r
 
 
 class CalibrationOverlay:
@@ -56,6 +61,23 @@ class CalibrationOverlay:
         self.nudge_left_y: int = 0
         self.nudge_right_y: int = 0
 
+        # Scratch buffer for in-place translate_into() (allocated lazily,
+        # re-allocated if the eye frame size changes)
+        self._nudge_scratch: np.ndarray | None = None
+        # ((w, h), h-line, v-line, centre) – see _draw_crosshair()
+        self._xhair_geom: tuple | None = None
+        # Crosshair colour per alpha; alpha 1.0 is the configured colour
+        base = tuple(int(c) for c in cfg.crosshair_color)
+        self._xhair_colors: dict[float, tuple[int, ...]] = {1.0: base}
+
+        # Per-frame callable specialised for the current phase / nudge
+        # state; rebuilt by _compile() after any state change.
+        self._apply_fn = _passthrough
+        self._dirty = True
+        # False only while _apply_fn is the pass-through, so the main loop
+        # can skip calling process() with one attribute load
+        self.needs_processing = True
+
     # ------------------------------------------------------------------
     # Control
     # ------------------------------------------------------------------
@@ -67,6 +89,7 @@ class CalibrationOverlay:
         else:
             self.active = True
             self._phase = "left"
+        self._mark_dirty()
 
     def next_phase(self):
         """Advance to the next calibration phase.
@@ -81,6 +104,7 @@ class CalibrationOverlay:
             self._phase = "fuse"
         elif self._phase == "fuse":
             self.active = False
+        self._mark_dirty()
 
     @property
     def phase(self) -> str:
@@ -99,6 +123,7 @@ class CalibrationOverlay:
             self.nudge_left -= self.NUDGE_STEP
         elif self._phase == "right":
             self.nudge_right -= self.NUDGE_STEP
+        self._mark_dirty()
 
     def nudge_current_right(self):
         """Shift the currently-active eye's image to the right."""
@@ -108,6 +133,7 @@ class CalibrationOverlay:
             self.nudge_left += self.NUDGE_STEP
         elif self._phase == "right":
             self.nudge_right += self.NUDGE_STEP
+        self._mark_dirty()
 
     def reset_nudge(self):
         """Reset all nudge offsets (X and Y) to zero."""
@@ -115,6 +141,7 @@ class CalibrationOverlay:
         self.nudge_right = 0
         self.nudge_left_y = 0
         self.nudge_right_y = 0
+        self._mark_dirty()
 
     def set_nudge_y(self, eye: str, value: int) -> None:
         """Set the vertical nudge offset (in pixels) for one eye.
@@ -126,40 +153,57 @@ class CalibrationOverlay:
             self.nudge_left_y = int(value)
         elif eye == "right":
             self.nudge_right_y = int(value)
+        self._mark_dirty()
 
     # ------------------------------------------------------------------
     # Per-frame application
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _roll_and_zero(img: np.ndarray, shift: int, axis: int) -> np.ndarray:
-        """Roll ``img`` by ``shift`` along ``axis`` and zero the wrapped border."""
-        if shift == 0:
-            return img
-        img = np.roll(img, shift, axis=axis)
-        if axis == 0:
-            if shift > 0:
-                img[:shift, :] = 0
-            else:
-                img[shift:, :] = 0
-        else:
-            if shift > 0:
-                img[:, :shift] = 0
-            else:
-                img[:, shift:] = 0
-        return img
+    def translate_into(self, src: np.ndarray, dst: np.ndarray, dx: int, dy: int) -> np.ndarray:
+        """Write ``src`` shifted by ``(dx, dy)`` pixels into ``dst``.
+
+        The uncovered border is zero-filled.  ``dst`` may be ``src``
+        itself (or a view sharing its memory, e.g. one half of the SBS
+        buffer); the source is then staged through a reusable scratch
+        buffer so the shift never reads pixels it has already written.
+        """
+        if np.shares_memory(src, dst):
+            buf = self._nudge_scratch
+            if buf is None or buf.shape != src.shape or buf.dtype != src.dtype:
+                buf = self._nudge_scratch = np.empty_like(src)
+            np.copyto(buf, src)
+            src = buf
+        h, w = src.shape[:2]
+        dx = max(-w, min(w, dx))
+        dy = max(-h, min(h, dy))
+        # Destination / source windows of the overlapping region
+        dx0, sx0 = max(dx, 0), max(-dx, 0)
+        dy0, sy0 = max(dy, 0), max(-dy, 0)
+        cw, ch = w - abs(dx), h - abs(dy)
+        dst[dy0:dy0 + ch, dx0:dx0 + cw] = src[sy0:sy0 + ch, sx0:sx0 + cw]
+        # Zero the uncovered border
+        if dy > 0:
+            dst[:dy] = 0
+        elif dy < 0:
+            dst[h + dy:] = 0
+        if dx > 0:
+            dst[:, :dx] = 0
+        elif dx < 0:
+            dst[:, w + dx:] = 0
+        return dst
 
     def apply_nudge(self, eye_l: np.ndarray, eye_r: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-        """Apply persistent per-eye nudge offsets (both X and Y) to both frames.
+        """Apply persistent per-eye nudge offsets (both X and Y) in place.
 
         Called every frame (even outside calibration) so the surgeon's
-        manual corrections are always active.  Uses ``np.roll`` for
-        speed; border pixels are zeroed to avoid wrap artefacts.
+        manual corrections are always active.  The eyes are normally the
+        two halves of the SBS buffer, so the shifted image lands there
+        directly and no copy-back is needed.
         """
-        eye_l = self._roll_and_zero(eye_l, self.nudge_left, axis=1)
-        eye_r = self._roll_and_zero(eye_r, self.nudge_right, axis=1)
-        eye_l = self._roll_and_zero(eye_l, self.nudge_left_y, axis=0)
-        eye_r = self._roll_and_zero(eye_r, self.nudge_right_y, axis=0)
+        if self.nudge_left or self.nudge_left_y:
+            self.translate_into(eye_l, eye_l, self.nudge_left, self.nudge_left_y)
+        if self.nudge_right or self.nudge_right_y:
+            self.translate_into(eye_r, eye_r, self.nudge_right, self.nudge_right_y)
         return eye_l, eye_r
 
     def apply(self, eye_l: np.ndarray, eye_r: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -171,24 +215,80 @@ class CalibrationOverlay:
         """
         if not self.active:
             return eye_l, eye_r
+        self._phase_fn()(eye_l, eye_r)
+        return eye_l, eye_r
 
-        if self._phase == "left":
-            eye_r[:] = 0
-            self._draw_crosshair(eye_l)
-            self._draw_phase_label(eye_l, "LEFT EYE", self.nudge_left)
-
-        elif self._phase == "right":
-            eye_l[:] = 0
-            self._draw_crosshair(eye_r)
-            self._draw_phase_label(eye_r, "RIGHT EYE", self.nudge_right)
-
-        elif self._phase == "fuse":
-            self._draw_crosshair(eye_l)
-            self._draw_crosshair(eye_r)
-            self._draw_fuse_label(eye_l)
-            self._draw_fuse_label(eye_r)
+    def process(self, eye_l: np.ndarray, eye_r: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Per-frame entry point: :meth:`apply_nudge` then :meth:`apply`.
 
-        return eye_l, eye_r
+        Runs a callable specialised for the current state, so the usual
+        "no nudge, not calibrating" frame is a single call that returns
+        its arguments.
+        """
+        if self._dirty:
+            self._compile()
+        return self._apply_fn(eye_l, eye_r)
+
+    def _mark_dirty(self):
+        # Callers write their state *before* this (set_nudge_y runs on a
+        # Flask thread), so a concurrent _compile either sees the new
+        # state or leaves _dirty set for the next frame.
+        self._dirty = True
+        self.needs_processing = True
+
+    def _compile(self):
+        """Rebuild ``_apply_fn`` with only the steps the current state needs."""
+        self._dirty = False
+        steps = []
+        if self.nudge_left or self.nudge_left_y:
+            dx_l, dy_l = self.nudge_left, self.nudge_left_y
+            steps.append(lambda l, r: self.translate_into(l, l, dx_l, dy_l))
+        if self.nudge_right or self.nudge_right_y:
+            dx_r, dy_r = self.nudge_right, self.nudge_right_y
+            steps.append(lambda l, r: self.translate_into(r, r, dx_r, dy_r))
+        if self.active:
+            steps.append(self._phase_fn())
+
+        # Keep the flag up if a mutator re-dirtied us mid-compile
+        self.needs_processing = bool(steps) or self._dirty
+        if not steps:
+            self._apply_fn = _passthrough
+        elif len(steps) == 1:
+            step = steps[0]
+
+            def run_one(eye_l, eye_r):
+                step(eye_l, eye_r)
+                return eye_l, eye_r
+            self._apply_fn = run_one
+        else:
+            def run_all(eye_l, eye_r):
+                for step in steps:
+                    step(eye_l, eye_r)
+                return eye_l, eye_r
+            self._apply_fn = run_all
+
+    def _phase_fn(self):
+        return {
+            "left": self._apply_left,
+            "right": self._apply_right,
+            "fuse": self._apply_fuse,
+        }[self._phase]
+
+    def _apply_left(self, eye_l: np.ndarray, eye_r: np.ndarray):
+        eye_r[:] = 0
+        self._draw_crosshair(eye_l)
+        self._draw_phase_label(eye_l, "LEFT EYE", self.nudge_left)
+
+    def _apply_right(self, eye_l: np.ndarray, eye_r: np.ndarray):
+        eye_l[:] = 0
+        self._draw_crosshair(eye_r)
+        self._draw_phase_label(eye_r, "RIGHT EYE", self.nudge_right)
+
+    def _apply_fuse(self, eye_l: np.ndarray, eye_r: np.ndarray):
+        self._draw_crosshair(eye_l)
+        self._draw_crosshair(eye_r)
+        self._draw_fuse_label(eye_l)
+        self._draw_fuse_label(eye_r)
 
     # ------------------------------------------------------------------
     # Drawing helpers
@@ -196,36 +296,40 @@ class CalibrationOverlay:
 
     def _draw_crosshair(self, img: np.ndarray, alpha: float = 1.0):
         h, w = img.shape[:2]
-        cx, cy = w // 2, h // 2
-        size = self.cfg.crosshair_size
-        color = tuple(int(c * alpha) for c in self.cfg.crosshair_color)
+        geom = self._xhair_geom
+        if geom is None or geom[0] != (w, h):
+            # Endpoints only change with the eye size; compute them once
+            cx, cy = w // 2, h // 2
+            size = self.cfg.crosshair_size
+            geom = self._xhair_geom = (
+                (w, h),
+                ((cx - size, cy), (cx + size, cy)),
+                ((cx, cy - size), (cx, cy + size)),
+                (cx, cy),
+            )
+        _, h_line, v_line, centre = geom
+        color = self._xhair_colors.get(alpha)
+        if color is None:
+            color = self._xhair_colors[alpha] = tuple(
+                int(c * alpha) for c in self._xhair_colors[1.0])
         thick = self.cfg.crosshair_thickness
 
-        cv2.line(img, (cx - size, cy), (cx + size, cy), color, thick)
-        cv2.line(img, (cx, cy - size), (cx, cy + size), color, thick)
-        cv2.circle(img, (cx, cy), 4, color, -1)
+        cv2.line(img, *h_line, color, thick)
+        cv2.line(img, *v_line, color, thick)
+        cv2.circle(img, centre, 4, color, -1)
 
     @staticmethod
     def _draw_phase_label(img: np.ndarray, label: str, nudge: int):
         """Draw phase label and nudge offset on the image."""
         h, w = img.shape[:2]
-        cv2.putText(img, label, (w // 2 - 100, 50),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 255), 2,
-                    cv2.LINE_AA)
+        put_text(img, label, (w // 2 - 100, 50), 1.0, (0, 255, 255), 2)
         nudge_txt = f"Nudge: {nudge:+d}px   (arrow keys to adjust)"
-        cv2.putText(img, nudge_txt, (w // 2 - 180, h - 40),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.65, (200, 200, 200), 1,
-                    cv2.LINE_AA)
-        cv2.putText(img, "Press N for next eye", (w // 2 - 130, h - 15),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.55, (150, 150, 150), 1,
-                    cv2.LINE_AA)
+        put_text(img, nudge_txt, (w // 2 - 180, h - 40), 0.65, (200, 200, 200))
+        put_text(img, "Press N for next eye", (w // 2 - 130, h - 15),
+                 0.55, (150, 150, 150))
 
     @staticmethod
     def _draw_fuse_label(img: np.ndarray):
         h, w = img.shape[:2]
-        cv2.putText(img, "FUSE - Both Eyes", (w // 2 - 130, 50),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2,
-                    cv2.LINE_AA)
-        cv2.putText(img, "Press N to finish", (w // 2 - 110, h - 30),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.55, (150, 150, 150), 1,
-                    cv2.LINE_AA)
+        put_text(img, "FUSE - Both Eyes", (w // 2 - 130, 50), 0.9, (0, 255, 0), 2)
+        put_text(img, "Press N to finish", (w // 2 - 110, h - 30), 0.55, (150, 150, 150))
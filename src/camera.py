@@ -10,7 +10,13 @@ with minimal latency.  Three back-ends are supported:
 
 from __future__ import annotations
 
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 import platform
+import struct
 import threading
 import time
 from typing import Optional, List, Tuple
@@ -19,10 +25,25 @@ import cv2
 import numpy as np
 
 
+# Byte → itself if printable ASCII, else "?" (for fourcc display)
+_FOURCC_PRINTABLE = bytes(c if 32 <= c < 127 else 0x3F for c in range(256))
+
+
+def _fourcc_to_str(fourcc: float) -> str:
+    """Decode a ``CAP_PROP_FOURCC`` value (little-endian chars) to e.g. ``"MJPG"``."""
+    packed = struct.pack("<I", int(fourcc) & 0xFFFFFFFF)
+    return packed.translate(_FOURCC_PRINTABLE).decode("ascii")
+
+
 class CameraCapture:
     """Threaded camera capture that continuously grabs frames in the
     background and exposes the most recent one via :meth:`read`."""
 
+    # Frame buffers the grab thread cycles through.  With three, a frame
+    # handed out by read_no_copy() stays intact for two more camera
+    # frames while the thread decodes into the third.
+    POOL_SIZE: int = 3
+
     def __init__(
         self,
         index: int = 0,
@@ -30,18 +51,44 @@ class CameraCapture:
         height: int = 1080,
         backend: str = "opencv",
         name: str = "camera",
+        low_latency: bool = True,
+        cpu: Optional[int] = None,
+        max_decode_fps: float = 0.0,
+        raw_mjpeg: bool = False,
     ):
         self.index = index
         self.width = width
         self.height = height
         self.backend = backend
         self.name = name
-
+        self.low_latency = low_latency
+        # Optional CPU core to pin the grab thread to (Linux only)
+        self.cpu = cpu
+        # When > 0, frames are grab()bed at camera rate but only
+        # retrieve()d (decoded) at most this often
+        self.max_decode_fps = max_decode_fps
+        # Fetch compressed MJPG from the driver and decode it ourselves
+        # (libjpeg-turbo via PyTurboJPEG when installed) – V4L2 only
+        self.raw_mjpeg = raw_mjpeg
+        self._decode = None
+        # Set when the backend rejects CAP_PROP_BUFFERSIZE=1: the grab
+        # loop then drains queued frames itself before each retrieve.
+        self._drain_queue = False
+
+        # Latest complete frame.  The grab thread decodes into the next
+        # of its pooled buffers and then swaps the reference – a single
+        # attribute store, atomic under the GIL – so readers never take
+        # a lock.  ``_lock`` only guards open/close.
         self._frame: Optional[np.ndarray] = None
         self._lock = threading.Lock()
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._cap = None
+        # Set by the grab thread whenever a new frame lands; cleared by
+        # wait_any().  ``_wake`` is an optional shared event set alongside
+        # it so one consumer can sleep on several cameras at once.
+        self._new_frame = threading.Event()
+        self._wake: Optional[threading.Event] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -49,43 +96,44 @@ class CameraCapture:
 
     def start(self) -> "CameraCapture":
         """Open the camera and start the background grab thread."""
-        if self.backend == "picamera2":
-            self._open_picamera2()
-        else:
-            self._open_opencv()
+        with self._lock:
+            if self.backend == "picamera2":
+                self._open_picamera2()
+            else:
+                self._open_opencv()
         self._running = True
         self._thread = threading.Thread(target=self._grab_loop, daemon=True, name=self.name)
         self._thread.start()
         # Warm up: wait for the first real frame (up to 2 s) so the
-        # main loop doesn't start with stale / empty data.
-        deadline = time.monotonic() + 2.0
-        while time.monotonic() < deadline:
-            with self._lock:
-                if self._frame is not None:
-                    break
-            time.sleep(0.02)
+        # main loop doesn't start with stale / empty data.  Nothing has
+        # cleared _new_frame yet, so it doubles as the first-frame signal.
+        self._new_frame.wait(timeout=2.0)
         return self
 
     def read(self) -> Optional[np.ndarray]:
         """Return the latest frame (BGR, np.ndarray) or *None*."""
-        with self._lock:
-            return self._frame.copy() if self._frame is not None else None
+        frame = self._frame
+        return frame.copy() if frame is not None else None
 
     def read_no_copy(self) -> Optional[np.ndarray]:
         """Return latest frame **without** copying – faster, but the caller
-        must NOT mutate the array."""
-        with self._lock:
-            return self._frame
+        must NOT mutate the array.
+
+        The buffer is recycled by the grab thread ``POOL_SIZE - 1``
+        frames later, so finish with it (or copy it) before then.
+        """
+        return self._frame
 
     def stop(self):
         self._running = False
         if self._thread is not None:
             self._thread.join(timeout=2.0)
-        if self._cap is not None:
-            if self.backend == "picamera2":
-                self._cap.stop()
-            else:
-                self._cap.release()
+        with self._lock:
+            if self._cap is not None:
+                if self.backend == "picamera2":
+                    self._cap.stop()
+                else:
+                    self._cap.release()
 
     # ------------------------------------------------------------------
     # Internals
@@ -113,7 +161,7 @@ class CameraCapture:
         self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         self._cap.set(cv2.CAP_PROP_FPS, 60)
-        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # minimal buffering
+        self._set_low_latency()
 
         # Try to negotiate MJPEG – ELP cameras decode MJPG in hardware
         # giving ~5× higher FPS at 1080p vs YUY2 (15fps vs 3fps).
@@ -134,21 +182,36 @@ class CameraCapture:
             self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
             self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
             self._cap.set(cv2.CAP_PROP_FPS, 60)
-            self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self._set_low_latency()
             actual_w = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             actual_h = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
         actual_fps = self._cap.get(cv2.CAP_PROP_FPS)
-        fourcc_int = int(self._cap.get(cv2.CAP_PROP_FOURCC))
-        fourcc_str = "".join(
-            chr(c) if 32 <= c < 127 else "?"
-            for c in ((fourcc_int >> 8 * i) & 0xFF for i in range(4))
-        )
+        fourcc_str = _fourcc_to_str(self._cap.get(cv2.CAP_PROP_FOURCC))
         print(
             f"[camera] {self.name}: opened index={self.index}  "
             f"{actual_w}x{actual_h} @ {actual_fps:.0f}fps  fourcc={fourcc_str}"
         )
 
+        # V4L2 only (DirectShow resets the fourcc on any later set, and
+        # other backends don't hand back the compressed bytes)
+        if (self.raw_mjpeg and fourcc_str == "MJPG"
+                and self._cap.getBackendName() == "V4L2"):
+            if self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+                self._decode = _mjpeg_decoder()
+            else:
+                print(f"[camera] {self.name}: raw MJPG not supported – using driver decode")
+
+    def _set_low_latency(self):
+        """Cap the driver queue at one frame, or fall back to draining."""
+        if not self.low_latency:
+            return
+        # set() returns False when the backend ignores the property
+        # (e.g. older V4L2 builds); default buffering is ~4 frames.
+        self._drain_queue = not self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if self._drain_queue:
+            print(f"[camera] {self.name}: BUFFERSIZE not supported – draining queue instead")
+
     def _open_picamera2(self):
         try:
             from picamera2 import Picamera2  # type: ignore
@@ -170,35 +233,339 @@ class CameraCapture:
         ``retrieve()`` can be unreliable from background threads.
         With ``CAP_PROP_BUFFERSIZE`` set to 1 the driver keeps at most
         one frame queued so the retrieved frame is close to real-time.
+
+        With ``max_decode_fps`` set, every frame is ``grab()``bed (cheap –
+        no MJPG decode) but ``retrieve()`` only runs once the decode
+        interval has elapsed, so frames nobody would see are never
+        decoded.
         """
+        if self.cpu is not None:
+            # Pin this thread so the L and R grabs run on separate cores.
+            # cap.read() already releases the GIL while it waits/decodes.
+            pin_current_thread({self.cpu})
+
         if self.backend == "picamera2":
             self._grab_loop_picamera()
             return
 
         cap = self._cap
+        bufs = self._make_pool()
+        idx = 0
+        # Raw MJPG mode: the driver hands back compressed bytes (1×N),
+        # which are decoded into the pool slot here
+        decode = self._decode
+        raw = None
+        # 10 % slack so camera jitter doesn't drop every other frame
+        # when the decode rate matches the camera rate
+        min_dt = 0.9 / self.max_decode_fps if self.max_decode_fps > 0 else 0.0
+        next_decode = 0.0
         while self._running:
-            ret, frame = cap.read()
+            # Decode straight into the next pool slot
+            dst = raw if decode is not None else bufs[idx]
+            if min_dt:
+                if not cap.grab():
+                    continue
+                now = time.monotonic()
+                if now < next_decode:
+                    continue
+                next_decode = now + min_dt
+                ret, frame = cap.retrieve(dst)
+            elif self._drain_queue:
+                ret, frame = self._read_latest(cap, dst)
+            else:
+                ret, frame = cap.read(dst)
+            if ret and frame is not None and decode is not None:
+                raw = frame
+                if raw.reshape(-1)[:2].tobytes() != b"\xff\xd8":
+                    # Not JPEG (no SOI marker) – hand decoding back to the driver
+                    print(f"[camera] {self.name}: raw frames are not JPEG – using driver decode")
+                    cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+                    decode = self._decode = None
+                    continue
+                frame = decode(raw, bufs[idx])
             if ret and frame is not None:
-                with self._lock:
-                    self._frame = frame
+                self._publish(bufs, idx, frame)
+                idx = (idx + 1) % len(bufs)
             # No sleep – read() already blocks until a frame arrives,
             # so this loop naturally runs at camera FPS.
 
+    def _make_pool(self) -> list[np.ndarray]:
+        """Preallocated frame pool, reused round-robin by the grab loop."""
+        # OpenCV only reallocates a slot if the driver's size differs
+        return [np.empty((self.height, self.width, 3), dtype=np.uint8)
+                for _ in range(self.POOL_SIZE)]
+
+    def _publish(self, bufs: list[np.ndarray], idx: int, frame: np.ndarray):
+        """Make *frame* (just written to pool slot *idx*) the latest."""
+        bufs[idx] = frame
+        self._frame = frame
+        self._signal_frame()
+
+    def _signal_frame(self):
+        self._new_frame.set()
+        wake = self._wake
+        if wake is not None:
+            wake.set()
+
+    @staticmethod
+    def _read_latest(cap, buf: Optional[np.ndarray] = None) -> tuple[bool, Optional[np.ndarray]]:
+        """``grab()`` until one blocks (>1 ms), then ``retrieve()`` it.
+
+        Queued frames come back immediately; the first grab that has to
+        wait for the sensor is the newest frame.  Bounded so a driver
+        that never blocks can't stall the loop.
+        """
+        for _ in range(8):
+            t0 = time.perf_counter()
+            if not cap.grab():
+                return False, None
+            if time.perf_counter() - t0 > 0.001:
+                break
+        return cap.retrieve(buf)
+
     def _grab_loop_picamera(self):
         """Grab loop variant for picamera2."""
         while self._running:
             frame = self._cap.capture_array("main")  # type: ignore
             if frame is not None:
-                with self._lock:
-                    self._frame = frame
+                self._frame = frame
+                self._signal_frame()
             else:
                 time.sleep(0.001)
 
 
+def _mjpeg_decoder():
+    """Return ``decode(jpeg_bytes, buf) -> BGR frame`` for raw MJPG.
+
+    Prefers PyTurboJPEG (SIMD libjpeg-turbo, decodes straight into *buf*
+    when the installed version supports ``dst``) and falls back to
+    ``cv2.imdecode``.  Output stays BGR – everything downstream is BGR.
+    """
+    try:
+        from turbojpeg import TurboJPEG, TJPF_BGR  # type: ignore
+    except ImportError:
+        return lambda jpg, buf: cv2.imdecode(jpg, cv2.IMREAD_COLOR)
+    import inspect
+    tj = TurboJPEG()
+    if "dst" in inspect.signature(tj.decode).parameters:
+        return lambda jpg, buf: tj.decode(jpg, pixel_format=TJPF_BGR, dst=buf)
+    return lambda jpg, buf: tj.decode(jpg, pixel_format=TJPF_BGR)
+
+
+def allowed_cpus() -> list[int]:
+    """CPU indices this process may run on, in ascending order.
+
+    Honours the inherited affinity mask (``taskset``, cgroup cpusets)
+    where the OS exposes it; elsewhere assumes every CPU is available.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def pin_current_thread(cpus) -> bool:
+    """Restrict the calling thread to the CPU indices in *cpus*.
+
+    Uses ``sched_setaffinity`` on Linux and ``SetThreadAffinityMask`` on
+    Windows; elsewhere (macOS) it is a no-op.  Returns True on success.
+    """
+    cpus = set(cpus)
+    if not cpus:
+        return False
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, cpus)  # 0 = calling thread
+            return True
+        except OSError:
+            return False
+    if platform.system() == "Windows":
+        import ctypes
+        k32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        k32.GetCurrentThread.restype = ctypes.c_void_p
+        k32.SetThreadAffinityMask.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+        k32.SetThreadAffinityMask.restype = ctypes.c_size_t
+        mask = sum(1 << c for c in cpus)
+        return k32.SetThreadAffinityMask(k32.GetCurrentThread(), mask) != 0
+    return False
+
+
+def wait_any(cams, timeout: float, wake: Optional[threading.Event] = None) -> bool:
+    """Block until any of *cams* has a new frame, *wake* is set, or *timeout*.
+
+    Returns True if at least one camera delivered a frame since the last
+    call (the per-camera flags are then cleared).  *wake* doubles as the
+    shared event the cameras signal, so other producers (e.g. the web
+    command queue) can set it to interrupt the wait early.
+    """
+    if wake is None:
+        wake = threading.Event()
+    for cam in cams:
+        cam._wake = wake
+    if not any(cam._new_frame.is_set() for cam in cams):
+        wake.clear()
+        # Re-check after clearing so a frame landing in between is not lost
+        if not any(cam._new_frame.is_set() for cam in cams):
+            wake.wait(timeout)
+    got = False
+    for cam in cams:
+        if cam._new_frame.is_set():
+            cam._new_frame.clear()
+            got = True
+    return got
+
+
+# ---------------------------------------------------------------------------
+# Process-based capture (grab loop outside the GIL entirely)
+# ---------------------------------------------------------------------------
+
+class _SharedMemoryCapture(CameraCapture):
+    """Child-process side of :class:`ProcessCameraCapture`.
+
+    Runs the normal grab loop, but its frame pool is the shared-memory
+    slots and publishing stores the slot index for the parent.
+    """
+
+    def _make_pool(self) -> list[np.ndarray]:
+        return list(self._slots)
+
+    def _publish(self, bufs, idx, frame):
+        slot = self._slots[idx]
+        if frame is not slot:
+            # Driver delivered another size – fit it into the shared slot
+            cv2.resize(frame, (slot.shape[1], slot.shape[0]), dst=slot)
+            bufs[idx] = slot
+        self._latest.value = idx
+        self._frame_evt.set()
+
+
+def _grab_process(kwargs: dict, shm_name: str, shape: tuple, latest, frame_evt,
+                  run_flag, errors):
+    """Entry point of the grab process (module level so ``spawn`` can pickle it)."""
+    shm = SharedMemory(name=shm_name)
+    cam = _SharedMemoryCapture(**kwargs)
+    cam._slots = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    cam._latest, cam._frame_evt = latest, frame_evt
+    try:
+        cam._open_opencv()
+    except RuntimeError as e:
+        errors.put(str(e))
+        return
+    cam._running = True
+    thread = threading.Thread(target=cam._grab_loop, daemon=True, name=cam.name)
+    thread.start()
+    while run_flag.value:
+        time.sleep(0.05)
+    cam._running = False
+    thread.join(timeout=2.0)
+    cam._cap.release()
+    cam._slots = None
+    shm.close()
+
+
+class ProcessCameraCapture(CameraCapture):
+    """:class:`CameraCapture` whose grab loop runs in a separate process.
+
+    The child decodes straight into a ``POOL_SIZE``-slot ring in shared
+    memory and publishes the slot index; :meth:`read_no_copy` returns a
+    zero-copy view of that slot.  Capture and decode then never contend
+    for this process's GIL.  OpenCV back-ends only (not picamera2).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._kwargs = dict(
+            index=self.index, width=self.width, height=self.height,
+            backend=self.backend, name=self.name, low_latency=self.low_latency,
+            cpu=self.cpu, max_decode_fps=self.max_decode_fps,
+            raw_mjpeg=self.raw_mjpeg,
+        )
+        self._proc = None
+        self._shm: Optional[SharedMemory] = None
+        self._slots: Optional[np.ndarray] = None
+
+    def start(self) -> "ProcessCameraCapture":
+        # spawn, not fork: the parent already runs threads (and SDL)
+        ctx = multiprocessing.get_context("spawn")
+        shape = (self.POOL_SIZE, self.height, self.width, 3)
+        self._shm = SharedMemory(create=True, size=int(np.prod(shape)))
+        self._slots = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+        self._latest = ctx.Value("i", -1, lock=False)
+        self._frame_evt = ctx.Event()
+        self._run_flag = ctx.Value("b", 1, lock=False)
+        errors = ctx.Queue()
+        self._proc = ctx.Process(
+            target=_grab_process, daemon=True, name=self.name,
+            args=(self._kwargs, self._shm.name, shape, self._latest,
+                  self._frame_evt, self._run_flag, errors),
+        )
+        self._proc.start()
+        self._running = True
+        self._thread = threading.Thread(target=self._forward_loop, daemon=True,
+                                        name=f"{self.name}-fwd")
+        self._thread.start()
+        # Warm up: the child has to import OpenCV first, so allow longer
+        # than the in-process capture before giving up on a first frame
+        deadline = time.monotonic() + 5.0
+        while not self._new_frame.wait(timeout=0.05):
+            if not self._proc.is_alive():
+                self.stop()
+                msg = errors.get() if not errors.empty() else "grab process exited"
+                raise RuntimeError(msg)
+            if time.monotonic() > deadline:
+                break
+        return self
+
+    def _forward_loop(self):
+        """Turn the child's cross-process event into a published frame."""
+        while self._running:
+            if not self._frame_evt.wait(timeout=0.1):
+                continue
+            self._frame_evt.clear()
+            idx = self._latest.value
+            if idx >= 0:
+                self._frame = self._slots[idx]
+                self._signal_frame()
+
+    def stop(self):
+        self._running = False
+        if self._proc is not None:
+            self._run_flag.value = 0
+            self._proc.join(timeout=3.0)
+            if self._proc.is_alive():
+                self._proc.terminate()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self._frame = None
+        self._slots = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                pass  # a caller still holds a frame view – freed at exit
+            self._shm.unlink()
+            self._shm = None
+
+
 # ---------------------------------------------------------------------------
 # Camera discovery utility
 # ---------------------------------------------------------------------------
 
+def _probe_camera(idx: int) -> Optional[str]:
+    """Open camera *idx* and describe it, or return None if it won't open."""
+    if platform.system() == "Windows":
+        cap = cv2.VideoCapture(idx, cv2.CAP_DSHOW)
+    else:
+        cap = cv2.VideoCapture(idx)
+    try:
+        if not cap.isOpened():
+            return None
+        w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        return f"{w}x{h} fourcc={_fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC))}"
+    finally:
+        cap.release()
+
+
 def list_cameras(max_index: int = 10) -> List[Tuple[int, str]]:
     """Probe camera indices 0 … *max_index* and return a list of
     ``(index, description)`` tuples for every device that opens
@@ -209,22 +576,14 @@ def list_cameras(max_index: int = 10) -> List[Tuple[int, str]]:
         python -c "from src.camera import list_cameras; list_cameras()"
     """
     found: List[Tuple[int, str]] = []
-    for idx in range(max_index):
-        if platform.system() == "Windows":
-            cap = cv2.VideoCapture(idx, cv2.CAP_DSHOW)
-        else:
-            cap = cv2.VideoCapture(idx)
-        if cap.isOpened():
-            w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            fourcc_int = int(cap.get(cv2.CAP_PROP_FOURCC))
-            fourcc_str = "".join(chr((fourcc_int >> 8 * i) & 0xFF) for i in range(4))
-            desc = f"{w}x{h} fourcc={fourcc_str}"
+    # Opening a device is dominated by driver / USB latency (up to ~1 s
+    # on DirectShow) with the GIL released, so probe all indices at once
+    with ThreadPoolExecutor(max_workers=max(1, max_index)) as pool:
+        descs = list(pool.map(_probe_camera, range(max_index)))
+    for idx, desc in enumerate(descs):
+        if desc is not None:
             found.append((idx, desc))
             print(f"  [camera] index {idx}: {desc}")
-            cap.release()
-        else:
-            cap.release()
     if not found:
         print("  [camera] No cameras found.")
     return found
@@ -234,6 +593,49 @@ def list_cameras(max_index: int = 10) -> List[Tuple[int, str]]:
 # Test-pattern generator (no cameras needed)
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=4)
+def _pattern_background(width: int, height: int) -> np.ndarray:
+    """Zero-disparity part of the test pattern, shared by both eyes.
+
+    Checkerboard, screen-depth ring and the MID object are identical in
+    the L and R patterns, so they are drawn once per size and cached
+    (read-only); each eye then only draws its shifted objects on a copy.
+    """
+    img = np.empty((height, width, 3), dtype=np.uint8)
+    cx, cy = width // 2, height // 2
+
+    # --- Background checkerboard (zero disparity → screen depth) ---
+    block = 60
+    by = np.arange(height) // block
+    bx = np.arange(width) // block
+    odd = (by[:, None] + bx[None, :]) & 1
+    img[:] = np.where(odd, 80, 40).astype(np.uint8)[..., None]
+
+    # --- Ring at screen depth (0 px disparity) ---
+    cv2.circle(img, (cx, cy), 250, (80, 80, 80), 2)
+    cv2.putText(img, "screen", (cx - 45, cy + 270),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (80, 80, 80), 1)
+
+    # --- Object AT screen depth (0 px disparity) ---
+    cv2.circle(img, (cx, cy), 80, (0, 255, 120), 3)
+    cv2.putText(img, "MID", (cx - 25, cy + 8),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 120), 2)
+
+    img.setflags(write=False)
+    return img
+
+
+class _AlwaysSet(threading.Event):
+    """An Event that stays set (``clear()`` is a no-op)."""
+
+    def __init__(self):
+        super().__init__()
+        super().set()
+
+    def clear(self):
+        pass
+
+
 class TestPatternCamera(CameraCapture):
     """Generates a synthetic stereo-friendly test pattern so the display and
     zoom logic can be tested without physical cameras."""
@@ -242,15 +644,21 @@ class TestPatternCamera(CameraCapture):
         super().__init__(index=-1, width=width, height=height, backend="test", name=name)
         self.side = side
         self._base_frame = self._generate_pattern()
+        # Static pattern: freeze it so read() can hand out the array itself
+        # (any accidental in-place write raises instead of corrupting it)
+        self._base_frame.setflags(write=False)
 
     def start(self) -> "TestPatternCamera":
         self._running = True
-        self._frame = self._base_frame.copy()
-        # No background thread needed – the frame is static.
+        self._frame = self._base_frame
+        # No background thread needed – the frame is static.  Report it
+        # as always new so wait_any() never sleeps on a test pattern.
+        self._new_frame = _AlwaysSet()
         return self
 
     def read(self) -> Optional[np.ndarray]:
-        return self._base_frame.copy()
+        """Return the (read-only) pattern without copying – copy it to mutate."""
+        return self._base_frame
 
     def read_no_copy(self) -> Optional[np.ndarray]:
         return self._base_frame
@@ -267,26 +675,13 @@ class TestPatternCamera(CameraCapture):
         - Positive shift (L shifts right, R shifts left) → appears in front
         - Negative shift  → appears behind the screen
         """
-        img = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        # Checkerboard, screen ring and MID object (zero disparity)
+        img = _pattern_background(self.width, self.height).copy()
         cx, cy = self.width // 2, self.height // 2
 
-        # --- Background checkerboard (zero disparity → screen depth) ---
-        block = 60
-        for y in range(0, self.height, block):
-            for x in range(0, self.width, block):
-                if ((x // block) + (y // block)) % 2 == 0:
-                    img[y:y + block, x:x + block] = (40, 40, 40)
-                else:
-                    img[y:y + block, x:x + block] = (80, 80, 80)
-
         # Disparity sign: left eye shifts right (+), right eye shifts left (-)
         sign = 1 if self.side == "left" else -1
 
-        # --- Ring at screen depth (0 px disparity) ---
-        cv2.circle(img, (cx, cy), 250, (80, 80, 80), 2)
-        cv2.putText(img, "screen", (cx - 45, cy + 270),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (80, 80, 80), 1)
-
         # --- Object BEHIND the screen (negative disparity, -20 px) ---
         d_back = -20
         ox_back = cx + sign * d_back
@@ -294,11 +689,6 @@ class TestPatternCamera(CameraCapture):
         cv2.putText(img, "FAR", (ox_back - 22, cy - 145),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 180, 0), 2)
 
-        # --- Object AT screen depth (0 px disparity) ---
-        cv2.circle(img, (cx, cy), 80, (0, 255, 120), 3)
-        cv2.putText(img, "MID", (cx - 25, cy + 8),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 120), 2)
-
         # --- Object IN FRONT of the screen (positive disparity, +25 px) ---
         d_front = 25
         ox_front = cx + sign * d_front
@@ -6,6 +6,8 @@ rest of the codebase never has to worry about missing keys.
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import os
 import yaml
 from dataclasses import dataclass, field
@@ -30,6 +32,11 @@ class CamerasCfg:
     left: CameraDeviceCfg = field(default_factory=lambda: CameraDeviceCfg(index=0))
     right: CameraDeviceCfg = field(default_factory=lambda: CameraDeviceCfg(index=1))
     test_mode: bool = False
+    low_latency: bool = True   # keep at most one frame queued in the driver
+    max_decode_fps: float = 0.0  # 0 = decode every grabbed frame
+    raw_mjpeg: bool = False      # decode MJPG ourselves (V4L2, PyTurboJPEG)
+    grab_process: bool = False   # run each grab loop in its own process
+    pin_threads: bool = False    # pin grab / render / encoder threads to cores
 
 
 @dataclass
@@ -66,6 +73,7 @@ class StereoCfg:
     zoom: ZoomCfg = field(default_factory=ZoomCfg)
     convergence: ConvergenceCfg = field(default_factory=ConvergenceCfg)
     alignment: AlignmentCfg = field(default_factory=AlignmentCfg)
+    use_opencl: bool = False   # per-eye warp / resize + annotation blend via cv2.UMat
 
 
 @dataclass
@@ -84,6 +92,8 @@ class DisplayCfg:
     fullscreen: bool = True
     fps: int = 60
     monitor: str | int = "auto"   # "auto" detects Goovis, or integer index
+    use_cuda: bool = False        # BGR→RGB / resize via cv2.cuda if available
+    vsync: bool = False           # sync flip() to the panel refresh
 
 
 @dataclass
@@ -99,6 +109,7 @@ class ControlsCfg:
     calib_nudge_right: str = "RIGHT"
     reset: str = "r"
     quit: str = "ESCAPE"
+    pump_interval_ms: float = 0.0  # min gap between event pumps (0 = every frame)
 
 
 @dataclass
@@ -123,17 +134,36 @@ class PiccoloCfg:
 # Loader
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _merge_plan(cls) -> dict:
+    """Introspect *cls* once: field name → ``"nested"`` (a dataclass),
+    ``"tuple"`` (YAML gives lists) or ``"plain"``.  Annotations are
+    strings here, so the kind comes from the default instance."""
+    defaults = cls()
+    plan = {}
+    for f in dataclasses.fields(cls):
+        value = getattr(defaults, f.name)
+        if dataclasses.is_dataclass(value):
+            plan[f.name] = "nested"
+        elif isinstance(value, tuple):
+            plan[f.name] = "tuple"
+        else:
+            plan[f.name] = "plain"
+    return plan
+
+
 def _merge(dataclass_obj, raw_dict: dict | None):
     """Recursively overwrite dataclass fields from a plain dict."""
     if raw_dict is None:
         return dataclass_obj
+    plan = _merge_plan(type(dataclass_obj))
     for key, value in raw_dict.items():
-        if not hasattr(dataclass_obj, key):
+        kind = plan.get(key)
+        if kind is None:
             continue
-        current = getattr(dataclass_obj, key)
-        if hasattr(current, "__dataclass_fields__"):
-            _merge(current, value)
-        elif isinstance(current, tuple) and isinstance(value, list):
+        if kind == "nested":
+            _merge(getattr(dataclass_obj, key), value)
+        elif kind == "tuple" and isinstance(value, list):
             setattr(dataclass_obj, key, tuple(value))
         else:
             setattr(dataclass_obj, key, value)
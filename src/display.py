@@ -6,11 +6,15 @@ The surgeon's goggles see *only* the stereo SBS feed; the computer screen
 stays free for the web viewer and other tools.
 
 **Low-latency path:**
-- A single ``pygame.Surface`` is pre-allocated once and reused every frame.
-- ``pygame.surfarray.blit_array()`` writes directly into the surface
-  (no allocation, no intermediate copies).
-- BGR→RGB conversion uses a pre-allocated numpy buffer with
-  ``cv2.cvtColor()`` (faster than numpy slice reversal for large frames).
+- When the window surface is 32-bit (byte order B,G,R,X – the usual
+  case – or R,G,B,X), ``cv2.cvtColor()`` expands the BGR frame straight
+  into the window's pixel memory: one pass, no side buffer and no blit.
+- Otherwise a single ``pygame.Surface`` is created once in ``open()`` on top of a
+  pre-allocated RGB numpy buffer (``pygame.image.frombuffer`` shares the
+  memory), so writing the buffer updates the surface – no per-frame
+  Surface, no intermediate copies.
+- BGR→RGB conversion writes into that buffer with ``cv2.cvtColor()``
+  (faster than numpy slice reversal for large frames).
 
 The display **must** run on the main thread (platform requirement for
 Pygame / SDL).
@@ -18,7 +22,12 @@ Pygame / SDL).
 
 from __future__ import annotations
 
+import functools
 import os
+import platform
+import re
+import subprocess
+import sys
 import pygame
 import cv2
 import numpy as np
@@ -26,26 +35,121 @@ import numpy as np
 from .config import DisplayCfg
 
 
+@functools.lru_cache(maxsize=1)
 def _list_monitors() -> list[dict]:
-    """Return a list of dicts with keys: name, width, height, x, y, is_primary."""
+    """Return a list of dicts with keys: name, width, height, x, y, is_primary.
+
+    Queried once per process.  screeninfo / the OS are asked first; SDL
+    is only brought up (briefly) as a last resort, on hosts where
+    neither can enumerate monitors (macOS, pure Wayland, …).
+    """
     try:
-        from screeninfo import get_monitors  # type: ignore
-        return [
-            {"name": m.name, "width": m.width, "height": m.height,
-             "x": m.x, "y": m.y, "is_primary": m.is_primary}
-            for m in get_monitors()
-        ]
+        from screeninfo import get_monitors, ScreenInfoError  # type: ignore
     except ImportError:
-        # Fallback: only know about the Pygame default display
-        pygame.display.init()
-        sizes = pygame.display.get_desktop_sizes()
+        pass
+    else:
+        try:
+            return [
+                {"name": m.name, "width": m.width, "height": m.height,
+                 "x": m.x, "y": m.y, "is_primary": m.is_primary}
+                for m in get_monitors()
+            ]
+        except ScreenInfoError:
+            pass  # no enumerator for this session – try the OS directly
+    try:
+        if platform.system() == "Windows":
+            result = _monitors_win32()
+        else:
+            result = _monitors_xrandr()
+    except (OSError, subprocess.SubprocessError):
         result = []
+    if not result:
+        # Last resort: ask SDL (sizes only, positions assumed side by
+        # side), shutting it down again if it wasn't already up so
+        # StereoDisplay.open() still initialises it after the window
+        # position has been chosen
+        was_up = pygame.display.get_init()
+        try:
+            if not was_up:
+                pygame.display.init()
+            sizes = pygame.display.get_desktop_sizes()
+        except pygame.error:
+            sizes = []
+        finally:
+            if not was_up:
+                pygame.display.quit()
         x_offset = 0
         for i, (w, h) in enumerate(sizes):
             result.append({"name": f"Display {i}", "width": w, "height": h,
                            "x": x_offset, "y": 0, "is_primary": i == 0})
             x_offset += w
-        return result
+    return result
+
+
+# " 1: +*HDMI-1 1920/477x1080/268+1920+0  HDMI-1"
+_XRANDR_RE = re.compile(
+    r"^\s*\d+:\s+\+?(\*?)(\S+)\s+(\d+)/\d+x(\d+)/\d+\+(-?\d+)\+(-?\d+)"
+)
+
+
+def _monitors_xrandr() -> list[dict]:
+    """Parse ``xrandr --listmonitors`` (X11 / XWayland)."""
+    out = subprocess.run(["xrandr", "--listmonitors"], capture_output=True,
+                         text=True, timeout=2).stdout
+    result = []
+    for line in out.splitlines():
+        m = _XRANDR_RE.match(line)
+        if m:
+            primary, name, w, h, x, y = m.groups()
+            result.append({"name": name, "width": int(w), "height": int(h),
+                           "x": int(x), "y": int(y), "is_primary": bool(primary)})
+    return result
+
+
+def _monitors_win32() -> list[dict]:
+    """Enumerate monitors via user32 ``EnumDisplayMonitors``."""
+    import ctypes
+    from ctypes import wintypes
+
+    class MONITORINFOEXW(ctypes.Structure):
+        _fields_ = [("cbSize", wintypes.DWORD), ("rcMonitor", wintypes.RECT),
+                    ("rcWork", wintypes.RECT), ("dwFlags", wintypes.DWORD),
+                    ("szDevice", wintypes.WCHAR * 32)]
+
+    user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+    result = []
+
+    def _on_monitor(hmon, _hdc, _rect, _lparam):
+        info = MONITORINFOEXW()
+        info.cbSize = ctypes.sizeof(info)
+        if user32.GetMonitorInfoW(hmon, ctypes.byref(info)):
+            r = info.rcMonitor
+            result.append({"name": info.szDevice,
+                           "width": r.right - r.left, "height": r.bottom - r.top,
+                           "x": r.left, "y": r.top,
+                           "is_primary": bool(info.dwFlags & 1)})  # MONITORINFOF_PRIMARY
+        return True
+
+    proc_t = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC,
+                                ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+    user32.EnumDisplayMonitors(None, None, proc_t(_on_monitor), 0)
+    return result
+
+
+# 32-bit window channel masks (R, G, B) → cvtColor code that expands a
+# BGR frame into that memory layout (little-endian byte order)
+_WINDOW_CVT = {
+    (0xFF0000, 0x00FF00, 0x0000FF): cv2.COLOR_BGR2BGRA,   # B,G,R,X
+    (0x0000FF, 0x00FF00, 0xFF0000): cv2.COLOR_BGR2RGBA,   # R,G,B,X
+}
+
+
+def _cuda_available() -> bool:
+    """True if this OpenCV build has CUDA and a device is present."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
 
 
 def _find_goovis(monitors: list[dict]) -> dict | None:
@@ -75,6 +179,18 @@ class StereoDisplay:
         # Pre-allocated buffers (created in open())
         self._surface: pygame.Surface | None = None
         self._rgb_buf: np.ndarray | None = None
+        self._resize_buf: np.ndarray | None = None
+        # Set by open(): flip() then paces to the panel refresh itself
+        self.vsync = False
+        # cvtColor code to expand BGR frames straight into the window
+        # surface, or None when its layout needs the RGB buffer + blit
+        self._window_cvt: int | None = None
+        # Optional CUDA path: persistent device buffers + stream (open())
+        self.use_cuda = bool(getattr(cfg, "use_cuda", False)) and _cuda_available()
+        self._cuda_stream = None
+        self._gpu_in = None
+        self._gpu_sized = None
+        self._gpu_out = None
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -118,28 +234,58 @@ class StereoDisplay:
             # NOFRAME borderless window at the exact monitor position + size
             # This avoids Pygame's FULLSCREEN which always targets display 0.
             flags = pygame.NOFRAME | pygame.HWSURFACE | pygame.DOUBLEBUF
-            self.screen = pygame.display.set_mode(
-                (self.width, self.height), flags
-            )
         elif self.cfg.fullscreen:
             flags = pygame.FULLSCREEN | pygame.HWSURFACE | pygame.DOUBLEBUF
-            self.screen = pygame.display.set_mode(
-                (self.width, self.height), flags
-            )
         else:
-            self.screen = pygame.display.set_mode((self.width, self.height))
+            flags = 0
+        self.screen = self._set_mode(flags)
 
         pygame.display.set_caption("Piccolo – Stereo Display")
         self.clock = pygame.time.Clock()
 
-        # Pre-allocate the rendering surface and RGB buffer
-        self._surface = pygame.Surface((self.width, self.height))
+        # Pre-allocate the RGB buffer and a Surface sharing its memory
+        # (frombuffer wraps, it doesn't copy) – reused every frame
         self._rgb_buf = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._surface = pygame.image.frombuffer(
+            self._rgb_buf, (self.width, self.height), "RGB"
+        )
+        self._resize_buf = np.empty_like(self._rgb_buf)
+
+        # A padding-free 32-bit window can be written directly: e.g. R in
+        # bits 16-23 is B,G,R,X in memory on little-endian – exactly BGRA
+        if (sys.byteorder == "little"
+                and self.screen.get_bytesize() == 4
+                and self.screen.get_pitch() == self.width * 4
+                and self.screen.get_size() == (self.width, self.height)):
+            self._window_cvt = _WINDOW_CVT.get(tuple(self.screen.get_masks()[:3]))
+
+        if self.use_cuda:
+            # Device buffers are allocated once here, so the per-frame
+            # path never hits cudaMalloc.  The output already has the
+            # window's layout when it can be downloaded straight into it.
+            out_type = cv2.CV_8UC4 if self._window_cvt is not None else cv2.CV_8UC3
+            self._cuda_stream = cv2.cuda.Stream()
+            self._gpu_in = cv2.cuda_GpuMat()
+            self._gpu_sized = cv2.cuda_GpuMat(self.height, self.width, cv2.CV_8UC3)
+            self._gpu_out = cv2.cuda_GpuMat(self.height, self.width, out_type)
 
         actual_w, actual_h = self.screen.get_size()
         print(f"[display] Window opened: {actual_w}x{actual_h}  "
               f"fullscreen={self.cfg.fullscreen}")
 
+    def _set_mode(self, flags: int) -> pygame.Surface:
+        """``set_mode`` with vsync if configured, falling back without it."""
+        size = (self.width, self.height)
+        if self.cfg.vsync:
+            try:
+                surface = pygame.display.set_mode(size, flags, vsync=1)
+                self.vsync = True
+                return surface
+            except pygame.error as e:
+                print(f"[display] vsync unavailable ({e}) – using fps limiter")
+        self.vsync = False
+        return pygame.display.set_mode(size, flags)
+
     def close(self):
         # Clean up the env var
         os.environ.pop("SDL_VIDEO_WINDOW_POS", None)
@@ -156,20 +302,24 @@ class StereoDisplay:
         """
         if self.screen is None:
             return
-        # Resize if frame doesn't exactly match display
-        fh, fw = frame_bgr.shape[:2]
-        if fw != self.width or fh != self.height:
-            frame_bgr = cv2.resize(frame_bgr, (self.width, self.height))
-
-        # BGR → RGB into pre-allocated buffer (avoids allocation)
-        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
-
-        # frombuffer reads row-major (H,W,3) bytes directly –
-        # no transpose, no contiguous copy, no new Surface alloc.
-        surf = pygame.image.frombuffer(
-            bytes(self._rgb_buf.data), (self.width, self.height), "RGB"
-        )
-        self.screen.blit(surf, (0, 0))
+        if not self.use_cuda:
+            # Resize if frame doesn't exactly match display (into the
+            # pre-allocated buffer, so a mismatched source doesn't allocate)
+            fh, fw = frame_bgr.shape[:2]
+            if fw != self.width or fh != self.height:
+                frame_bgr = cv2.resize(frame_bgr, (self.width, self.height),
+                                       dst=self._resize_buf)
+
+        if self._window_cvt is not None:
+            self._write_screen(frame_bgr)
+        else:
+            # BGR → RGB into pre-allocated buffer (avoids allocation);
+            # _surface views _rgb_buf, so it then holds this frame
+            if self.use_cuda:
+                self._convert_cuda(frame_bgr, cv2.COLOR_BGR2RGB, self._rgb_buf)
+            else:
+                cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            self.screen.blit(self._surface, (0, 0))
 
         # Overlay pedal mode if provided
         if pedal_mode:
@@ -180,7 +330,45 @@ class StereoDisplay:
 
         pygame.display.flip()
 
+    def _write_screen(self, frame_bgr: np.ndarray):
+        """Expand *frame_bgr* into the window surface's pixel memory.
+
+        ``get_buffer()`` locks the surface; the lock is released when
+        ``buf`` and the view on it go out of scope on return, before the
+        pedal overlay blit and ``flip()``.
+        """
+        buf = self.screen.get_buffer()
+        px = np.frombuffer(buf, dtype=np.uint8).reshape(self.height, self.width, 4)
+        if self.use_cuda:
+            self._convert_cuda(frame_bgr, self._window_cvt, px)
+        else:
+            cv2.cvtColor(frame_bgr, self._window_cvt, dst=px)
+
+    def _convert_cuda(self, frame_bgr: np.ndarray, code: int, dst: np.ndarray):
+        """Resize + colour-convert (*code*) on the GPU, downloading into *dst*.
+
+        *dst* is either ``_rgb_buf`` or the window's own pixel memory, so
+        the result lands in its final place with no host-side pass.
+        """
+        stream = self._cuda_stream
+        self._gpu_in.upload(frame_bgr, stream)
+        src = self._gpu_in
+        fh, fw = frame_bgr.shape[:2]
+        if fw != self.width or fh != self.height:
+            cv2.cuda.resize(src, (self.width, self.height),
+                            dst=self._gpu_sized, stream=stream)
+            src = self._gpu_sized
+        cv2.cuda.cvtColor(src, code, dst=self._gpu_out, stream=stream)
+        self._gpu_out.download(stream, dst)
+        stream.waitForCompletion()
+
     def tick(self) -> float:
-        """Limit frame-rate and return the measured delta-time in seconds."""
-        dt = self.clock.tick(self.cfg.fps) if self.clock else 16
+        """Limit frame-rate and return the measured delta-time in seconds.
+
+        With vsync, ``flip()`` already blocks until the panel refresh, so
+        the clock only measures – a second limiter would just add delay.
+        """
+        if not self.clock:
+            return 0.016
+        dt = self.clock.tick() if self.vsync else self.clock.tick(self.cfg.fps)
         return dt / 1000.0
@@ -10,15 +10,20 @@ override :meth:`poll` to read from GPIO / serial.
 
 from __future__ import annotations
 
+import functools
 import pygame
-from enum import Enum, auto
-from typing import Set
+import time
+from collections import deque
+from enum import IntEnum, auto
+from typing import TYPE_CHECKING, AbstractSet, Set
 
 from .config import ControlsCfg
-from .stereo_align import StereoAligner
 
+if TYPE_CHECKING:
+    from .stereo_align import StereoAligner
 
-class Action(Enum):
+
+class Action(IntEnum):
     ZOOM_IN = auto()
     ZOOM_OUT = auto()
     CONVERGE_IN = auto()
@@ -41,11 +46,42 @@ class Action(Enum):
     PEDAL_CENTER_DOWN = auto()
 
 
+# Actions that are held-to-repeat (continuous)
+_CONTINUOUS_ACTIONS: frozenset[Action] = frozenset((
+    Action.ZOOM_IN, Action.ZOOM_OUT,
+    Action.CONVERGE_IN, Action.CONVERGE_OUT,
+    Action.CALIB_NUDGE_LEFT, Action.CALIB_NUDGE_RIGHT,
+))
+
+_EMPTY_FROZENSET: frozenset[Action] = frozenset()
+
+
+@functools.lru_cache(maxsize=64)
+def _mask_actions(mask: int) -> frozenset[Action]:
+    """Expand an action bitmask into the set of actions it contains.
+
+    Only a handful of held-key combinations ever occur, so results are
+    cached and repeat presses reuse the same frozenset.
+    """
+    actions = []
+    while mask:
+        low = mask & -mask
+        actions.append(Action(low.bit_length() - 1))
+        mask ^= low
+    return frozenset(actions)
+
+
+# Lower-cased key name → Pygame key constant, e.g. ``'equals'`` → K_EQUALS
+_NAME_TO_KEY: dict[str, int] = {
+    name[2:].lower(): val
+    for name, val in vars(pygame).items() if name.startswith("K_")
+}
+
+
 def _key_const(name: str) -> int:
     """Resolve a human-friendly key name (from config) to a Pygame key
     constant.  E.g. ``'EQUALS'`` → ``pygame.K_EQUALS``."""
-    attr = f"K_{name.lower()}"
-    val = getattr(pygame, attr, None)
+    val = _NAME_TO_KEY.get(name.lower())
     if val is not None:
         return val
     # Try single character
@@ -57,50 +93,67 @@ def _key_const(name: str) -> int:
 class InputHandler:
     """Polls Pygame events and exposes the set of currently active actions."""
 
+    # The only event types poll() dispatches; everything else is blocked
+    # at the SDL level so it is never queued or wrapped in Python objects
+    _WANTED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+
     def __init__(self, aligner: StereoAligner, cfg: ControlsCfg):
         self.aligner = aligner
         self.cfg = cfg
+        # Keys bound to one-shot actions
         self._keymap: dict[int, Action] = {}
+        # Keys bound to continuous actions → their held-mask bit
+        self._hold_bits: dict[int, int] = {}
         self._build_keymap()
-        self._held: Set[Action] = set()
+        # Held continuous actions as a bitmask; _held is its set form,
+        # rebuilt only when a key changes the mask
+        self._held_mask = 0
+        self._held: frozenset[Action] = _EMPTY_FROZENSET
+        # Min seconds between SDL pumps on idle frames (0 = every poll);
+        # the main loop may retune this to its render rate
+        self.pump_interval = cfg.pump_interval_ms / 1000.0
+        self._last_pump = 0.0
+        # Scratch set for the actions fired during one poll(), reused and
+        # returned as-is when nothing is held
+        self._one_shot_buf: Set[Action] = set()
         # Pedal toggle mode: None | 'a' (zoom) | 'b' (side) | 'c' (up/down)
         self.pedal_mode: str | None = None
         # Maps adjust-pedal key → action, for continuous long-press
         self._pedal_adjust_held: dict[str, Action] = {}
-        # Track held numpad keys for pedal combos (legacy)
-        self._npad_held = set()
-    def _pedal_key(self, event):
-        # Map pedal keys: a=left, b=middle, c=right
-        if not hasattr(event, "key"):
-            return None
-        if event.key == ord('a'):
-            return 'a'
-        elif event.key == ord('b'):
-            return 'b'
-        elif event.key == ord('c'):
-            return 'c'
-        return None
-
-    # Pedal mode → (adjust-pedal-b action, adjust-pedal-c action or adjust-pedal-a action)
+        # Held numpad keys for pedal combos (legacy), in press order
+        self._npad_held: deque[int] = deque(maxlen=3)
+        self._event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_keydown,
+            pygame.KEYUP: self._on_keyup,
+        }
+        # The event filter needs SDL up, so it is installed on first poll()
+        self._events_filtered = False
+
+    # Pedal keys: a=left, b=middle, c=right
+    _PEDAL_KEYS = {ord('a'): 'a', ord('b'): 'b', ord('c'): 'c'}
+    # Legacy numpad pedal keys, tracked for combos
+    _NUMPAD_KEYS = frozenset((pygame.K_KP4, pygame.K_KP5, pygame.K_KP6))
+
+    # (pedal mode, adjust pedal) → action
     # 'a' = zoom:      b → ZOOM_IN,           c → ZOOM_OUT
     # 'b' = side:      a → CENTER_LEFT,        c → CENTER_RIGHT
     # 'c' = up/down:   a → CENTER_UP,          b → CENTER_DOWN
-    _PEDAL_ADJUST_MAP: dict[str, dict[str, Action]] = {
-        'a': {'b': Action.ZOOM_IN,            'c': Action.ZOOM_OUT},
-        'b': {'a': Action.PEDAL_CENTER_LEFT,  'c': Action.PEDAL_CENTER_RIGHT},
-        'c': {'a': Action.PEDAL_CENTER_UP,    'b': Action.PEDAL_CENTER_DOWN},
+    _PEDAL_ADJUST_MAP: dict[tuple[str, str], Action] = {
+        ('a', 'b'): Action.ZOOM_IN,            ('a', 'c'): Action.ZOOM_OUT,
+        ('b', 'a'): Action.PEDAL_CENTER_LEFT,  ('b', 'c'): Action.PEDAL_CENTER_RIGHT,
+        ('c', 'a'): Action.PEDAL_CENTER_UP,    ('c', 'b'): Action.PEDAL_CENTER_DOWN,
     }
+    _PEDAL_MODE_NAMES = {'a': 'ZOOM', 'b': 'SIDE', 'c': 'UP/DOWN'}
 
     def _pedal_adjust_action(self, pedal: str) -> Action | None:
         """Return the action for an adjust pedal given the current mode."""
-        if self.pedal_mode is None:
-            return None
-        return self._PEDAL_ADJUST_MAP.get(self.pedal_mode, {}).get(pedal)
+        return self._PEDAL_ADJUST_MAP.get((self.pedal_mode, pedal))
 
-    def get_pedal_mode(self):
+    def get_pedal_mode(self) -> str | None:
         return self.pedal_mode
 
-    def _build_keymap(self):
+    def _build_keymap(self) -> None:
         mapping = {
             "zoom_in": Action.ZOOM_IN,
             "zoom_out": Action.ZOOM_OUT,
@@ -133,152 +186,160 @@ class InputHandler:
                         self._keymap[_key_const(key_name)] = action
                     except ValueError:
                         pass  # skip unmappable keys
+        # Resolve hold-vs-one-shot per key now rather than on every event
+        for key, action in list(self._keymap.items()):
+            if action in _CONTINUOUS_ACTIONS:
+                self._hold_bits[key] = 1 << action
+                del self._keymap[key]
+        # Build the single-key held sets now so the first press of each
+        # hold key does not pay for it inside poll()
+        for bit in self._hold_bits.values():
+            _mask_actions(bit)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    # Actions that are held-to-repeat (continuous)
-    _CONTINUOUS = {
-        Action.ZOOM_IN, Action.ZOOM_OUT,
-        Action.CONVERGE_IN, Action.CONVERGE_OUT,
-        Action.CALIB_NUDGE_LEFT, Action.CALIB_NUDGE_RIGHT,
-    }
-
-    def _handle_pedal_logic(self, event, one_shot):
-        """Handle pedal-related actions based on the current pedal mode."""
-        if event.key == pygame.K_F1:  # Left pedal
-            self.pedal_mode = (self.pedal_mode + 1) % 3
-            if self.pedal_mode == 0:
-                one_shot.add(Action.PEDAL_MODE_TOGGLE)
-            elif self.pedal_mode == 1:
-                one_shot.add(Action.PEDAL_MODE_CENTER_X)
-            elif self.pedal_mode == 2:
-                one_shot.add(Action.PEDAL_MODE_CENTER_Y)
-        elif event.key == pygame.K_F2:  # Middle pedal
-            if self.pedal_mode == 0:
-                one_shot.add(Action.PEDAL_ZOOM_IN)
-            elif self.pedal_mode == 1:
-                one_shot.add(Action.PEDAL_CENTER_LEFT)
-            elif self.pedal_mode == 2:
-                one_shot.add(Action.PEDAL_CENTER_UP)
-        elif event.key == pygame.K_F3:  # Right pedal
-            if self.pedal_mode == 0:
-                one_shot.add(Action.PEDAL_ZOOM_OUT)
-            elif self.pedal_mode == 1:
-                one_shot.add(Action.PEDAL_CENTER_RIGHT)
-            elif self.pedal_mode == 2:
-                one_shot.add(Action.PEDAL_CENTER_DOWN)
-
-    def _handle_key_event(self, event, one_shot):
-        """Handle key press and release events, including pedal toggle logic."""
-        pedal = self._pedal_key(event)
-        if event.type == pygame.KEYDOWN:
-            if pedal:
-                if self.pedal_mode == pedal:
-                    # Same pedal pressed again → toggle mode off, stop any adjust
-                    self._clear_pedal_adjust()
-                    self.pedal_mode = None
-                    print(f"[pedal] mode OFF")
-                elif self.pedal_mode is None:
-                    # No mode active → toggle this pedal's mode on
-                    self.pedal_mode = pedal
-                    mode_names = {'a': 'ZOOM', 'b': 'SIDE', 'c': 'UP/DOWN'}
-                    print(f"[pedal] mode → {mode_names.get(pedal, pedal)}")
-                else:
-                    # Mode active, different pedal → adjust (immediate + continuous)
-                    action = self._pedal_adjust_action(pedal)
-                    if action is not None:
-                        one_shot.add(action)
-                        self._pedal_adjust_held[pedal] = action
-
-            # Legacy numpad support
-            if event.key in (pygame.K_KP4, pygame.K_KP5, pygame.K_KP6):
-                self._npad_held.add(event.key)
-            action = self._keymap.get(event.key)
-            if action is not None:
-                if action in self._CONTINUOUS:
-                    self._held.add(action)
-                else:
+    def _on_quit(self, event: pygame.event.Event, one_shot: Set[Action]) -> None:
+        one_shot.add(Action.QUIT)
+
+    def _on_keydown(self, event: pygame.event.Event, one_shot: Set[Action]) -> None:
+        """Handle a key press, including pedal toggle logic."""
+        key = event.key
+        pedal = self._PEDAL_KEYS.get(key)
+        if pedal:
+            if self.pedal_mode == pedal:
+                # Same pedal pressed again → toggle mode off, stop any adjust
+                self._clear_pedal_adjust()
+                self.pedal_mode = None
+                print(f"[pedal] mode OFF")
+            elif self.pedal_mode is None:
+                # No mode active → toggle this pedal's mode on
+                self.pedal_mode = pedal
+                print(f"[pedal] mode → {self._PEDAL_MODE_NAMES[pedal]}")
+            else:
+                # Mode active, different pedal → adjust (immediate + continuous)
+                action = self._pedal_adjust_action(pedal)
+                if action is not None:
                     one_shot.add(action)
-
-        elif event.type == pygame.KEYUP:
-            if pedal and pedal in self._pedal_adjust_held:
-                # Adjust pedal released → stop continuous action
-                del self._pedal_adjust_held[pedal]
-            if event.key in (pygame.K_KP4, pygame.K_KP5, pygame.K_KP6):
-                self._npad_held.discard(event.key)
-            action = self._keymap.get(event.key)
+                    self._pedal_adjust_held[pedal] = action
+
+        # Legacy numpad support
+        if key in self._NUMPAD_KEYS and key not in self._npad_held:
+            self._npad_held.append(key)
+        bit = self._hold_bits.get(key)
+        if bit is None:
+            action = self._keymap.get(key)
             if action is not None:
-                self._held.discard(action)
-
-    def _clear_pedal_adjust(self):
+                one_shot.add(action)
+        elif not self._held_mask & bit:
+            self._held_mask |= bit
+            self._held = _mask_actions(self._held_mask)
+
+    def _on_keyup(self, event: pygame.event.Event, one_shot: Set[Action]) -> None:
+        """Handle a key release."""
+        key = event.key
+        pedal = self._PEDAL_KEYS.get(key)
+        if pedal and pedal in self._pedal_adjust_held:
+            # Adjust pedal released → stop continuous action
+            del self._pedal_adjust_held[pedal]
+        if key in self._npad_held:
+            self._npad_held.remove(key)
+        bit = self._hold_bits.get(key)
+        if bit is not None and self._held_mask & bit:
+            self._held_mask &= ~bit
+            self._held = _mask_actions(self._held_mask)
+
+    def _clear_pedal_adjust(self) -> None:
         """Stop all continuous pedal adjust actions."""
         self._pedal_adjust_held.clear()
 
-    def _determine_combo_action(self, pressed):
-        """Determine combo actions based on numpad keys."""
-        kp4, kp5, kp6 = pygame.K_KP4, pygame.K_KP5, pygame.K_KP6
-        combo_keys = [kp4, kp5, kp6]
-        pressed_numpad = [k for k in combo_keys if pressed[k]]
-
-        if len(pressed_numpad) < 2:
+    def _determine_combo_action(self) -> Action | None:
+        """Determine combo actions based on held numpad keys."""
+        npad_held = self._npad_held
+        if len(npad_held) < 2:
             return None
-
-        first, second = self._get_first_and_second_keys(self._npad_held, pressed_numpad)
-        return self._map_combo_to_action(first, second)
-
-    def _get_first_and_second_keys(self, npad_held, pressed_numpad):
-        """Get the first and second keys from the pressed numpad keys."""
-        npad_held_order = list(npad_held)
-        if not npad_held_order:
-            return None, None
-
-        first = npad_held_order[0]
-        second = next((k for k in pressed_numpad if k != first), None)
-        return first, second
-
-    def _map_combo_to_action(self, first, second):
+        # The key held first selects the pedal, the next one the combo
+        return self._map_combo_to_action(npad_held[0], npad_held[1])
+
+    # Numpad keycode → combo table index
+    _KP_INDEX = {pygame.K_KP4: 0, pygame.K_KP5: 1, pygame.K_KP6: 2}
+    # Combo actions indexed by first * 3 + second (KP4=0, KP5=1, KP6=2)
+    _COMBO_LUT: tuple[Action | None, ...] = (
+        # Left pedal held: 4+4, 4+5, 4+6
+        None, Action.PEDAL_CENTER_UP, Action.PEDAL_CENTER_DOWN,
+        # Middle pedal held: 5+4, 5+5, 5+6
+        Action.ZOOM_IN, None, Action.ZOOM_OUT,
+        # Right pedal held: 6+4, 6+5, 6+6
+        Action.CALIB_NUDGE_LEFT, Action.CALIB_NUDGE_RIGHT, None,
+    )
+
+    def _map_combo_to_action(self, first: int | None, second: int | None) -> Action | None:
         """Map the first and second keys to a combo action (pedal logic)."""
-        kp4, kp5, kp6 = pygame.K_KP4, pygame.K_KP5, pygame.K_KP6
-
-        # Middle pedal held
-        if first == kp5:
-            if second == kp4:
-                return Action.ZOOM_IN
-            elif second == kp6:
-                return Action.ZOOM_OUT
-        # Right pedal held
-        elif first == kp6:
-            if second == kp5:
-                return Action.CALIB_NUDGE_RIGHT
-            elif second == kp4:
-                return Action.CALIB_NUDGE_LEFT
-        # Left pedal held
-        elif first == kp4:
-            if second == kp5:
-                return Action.PEDAL_CENTER_UP
-            elif second == kp6:
-                return Action.PEDAL_CENTER_DOWN
-
-        return None
-
-    def poll(self) -> Set[Action]:
-        """Process all pending Pygame events and return the set of actions."""
-        one_shot: Set[Action] = set()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                one_shot.add(Action.QUIT)
-            else:
-                self._handle_key_event(event, one_shot)
-
-        pressed = pygame.key.get_pressed()
-        combo_action = self._determine_combo_action(pressed)
-
+        kp_index = self._KP_INDEX
+        if first not in kp_index or second not in kp_index:
+            return None
+        return self._COMBO_LUT[kp_index[first] * 3 + kp_index[second]]
+
+    def _drain_events(self) -> list[pygame.event.Event]:
+        """Pump SDL once, then drain the wanted events in a single batch.
+
+        Never calls ``get(types)``: SDL returns those grouped by type, so a
+        key released and pressed again within one frame would come back
+        press-first and end up released.
+        """
+        if not self._events_filtered:
+            # Stop SDL queueing anything else (mouse motion, window
+            # events, …) so a plain get() only ever sees wanted events.
+            # Blocking flushes the queue, so keep anything wanted that is
+            # pending, in order.
+            wanted = self._WANTED_EVENTS
+            pending = [e for e in pygame.event.get() if e.type in wanted]
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(wanted)
+            self._events_filtered = True
+            return pending + pygame.event.get()
+        pygame.event.pump()
+        # The queue is already up to date, so skip get()'s implicit pump
+        return pygame.event.get(pump=False)
+
+    def poll(self) -> AbstractSet[Action]:
+        """Process all pending Pygame events and return the set of actions.
+
+        The result may be shared with later frames or be a scratch buffer
+        that the next call clears, so callers must not mutate it and must
+        copy it if they need it beyond the current frame.
+        """
         # Continuous pedal adjust actions (long-press held pedals)
-        pedal_continuous = set(self._pedal_adjust_held.values())
-
+        pedal_adjust = self._pedal_adjust_held
+        npad_held = self._npad_held
+        # Idle fast path: no queued input and no combo / pedal repeat
+        # running, so the held set is already the answer
+        if self._events_filtered and not pedal_adjust and len(npad_held) < 2:
+            if self.pump_interval:
+                now = time.monotonic()
+                if now - self._last_pump < self.pump_interval:
+                    return self._held
+                self._last_pump = now
+            if not pygame.event.peek(self._WANTED_EVENTS):
+                return self._held
+
+        one_shot = self._one_shot_buf
+        one_shot.clear()
+
+        handlers = self._event_handlers
+        for event in self._drain_events():
+            handlers[event.type](event, one_shot)
+
+        combo_action = (self._determine_combo_action()
+                        if len(npad_held) >= 2 else None)
         if combo_action:
-            return {combo_action} | one_shot | pedal_continuous
-        return self._held | one_shot | pedal_continuous
+            return {combo_action} | one_shot | set(pedal_adjust.values())
+        if not pedal_adjust:
+            if not one_shot:
+                # Idle / hold-only frame: nothing new to merge
+                return self._held
+            if not self._held:
+                # Key presses only: hand out the scratch buffer itself
+                return one_shot
+        return self._held | one_shot | set(pedal_adjust.values())
@@ -57,15 +57,19 @@ The new pipeline:
 from __future__ import annotations
 
 import math
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple, TypeVar
 
 import cv2
 import numpy as np
 
 from .config import AlignmentCfg
 
+_T = TypeVar("_T")
+
 
 # ------------------------------------------------------------------
 # Alignment result
@@ -92,6 +96,8 @@ class StereoAligner:
 
     # Spatial-distribution grid (matches per cell are capped)
     _GRID = 6
+    # Above this many descriptor pairs, match with FLANN, not brute force
+    _BF_MAX_PAIRS = 4_000_000
 
     def __init__(self, cfg: AlignmentCfg, frame_w: int, frame_h: int):
         self.cfg = cfg
@@ -101,15 +107,28 @@ class StereoAligner:
         # --- CLAHE for adaptive histogram equalisation ---
         # Dramatically improves SIFT detection in low-contrast surgery
         # tissue that the raw camera image would otherwise miss.
+        # CLAHE objects keep scratch state, so each eye gets its own
+        # instance to let the two run concurrently.
         self._clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
+        self._clahe_r = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
 
         # --- SIFT detector ---
         self._sift = cv2.SIFT_create(nfeatures=cfg.max_features)
 
-        # --- FLANN matcher (KD-tree) ---
-        index_params = dict(algorithm=1, trees=5)   # FLANN_INDEX_KDTREE
-        search_params = dict(checks=80)
-        self._matcher = cv2.FlannBasedMatcher(index_params, search_params)
+        # --- Left/right worker ---
+        # The right eye's preprocessing and SIFT run on this thread while
+        # the caller handles the left eye (OpenCV releases the GIL).  No
+        # point on a single core, where it would only add hand-off cost.
+        self._pool: Optional[ThreadPoolExecutor] = None
+        if (os.cpu_count() or 1) > 1:
+            self._pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="align-r")
+
+        # --- FLANN matching (KD-tree) ---
+        # Driven through cv2.flann.Index directly: knnSearch returns
+        # (indices, distances) arrays instead of DMatch objects.
+        self._flann_index_params = dict(algorithm=1, trees=5)   # FLANN_INDEX_KDTREE
+        self._flann_search_params = dict(checks=80)
 
         # Current alignment state
         self.result = AlignmentResult()
@@ -126,6 +145,11 @@ class StereoAligner:
         self._dst_l = np.empty((frame_h, frame_w, 3), dtype=np.uint8)
         self._dst_r = np.empty((frame_h, frame_w, 3), dtype=np.uint8)
 
+        # Per-eye (full-size grey, down-scaled grey) buffers for update()
+        self._gray_bufs: list = [None, None]
+        # Hann window for _phase_align, rebuilt only if the grey size changes
+        self._phase_window: Optional[np.ndarray] = None
+
         # Overlap mask – valid region where BOTH warped images have content.
         self._overlap_mask: Optional[np.ndarray] = None
         self._overlap_mask_3ch: Optional[np.ndarray] = None
@@ -164,6 +188,21 @@ class StereoAligner:
     def has_correction(self) -> bool:
         return self._warp_l is not None
 
+    def get_affines(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Current ``(left, right)`` 2 × 3 correction warps, or ``(None, None)``.
+
+        Lets the caller fold the correction into its own warp instead of
+        calling :meth:`warp_pair`.
+        """
+        if not self._enabled or self._warp_l is None:
+            return None, None
+        return self._warp_l, self._warp_r
+
+    @property
+    def overlap_mask(self) -> Optional[np.ndarray]:
+        """3-channel mask of the region valid in both warped frames."""
+        return self._overlap_mask_3ch
+
     @property
     def converged(self) -> bool:
         return self._converged
@@ -196,21 +235,12 @@ class StereoAligner:
         self._last_update = time.monotonic()
         self._update_count += 1
 
-        # --- Down-scale for speed ---
+        # --- Greyscale, down-scale for speed, CLAHE ---
+        # Converting first means the resize only moves ⅓ of the bytes
         s = self.cfg.detection_scale
-        if s < 1.0:
-            small_l = cv2.resize(frame_l, None, fx=s, fy=s,
-                                 interpolation=cv2.INTER_AREA)
-            small_r = cv2.resize(frame_r, None, fx=s, fy=s,
-                                 interpolation=cv2.INTER_AREA)
-        else:
-            small_l, small_r = frame_l, frame_r
-
-        # --- CLAHE on greyscale ---
-        gray_l = cv2.cvtColor(small_l, cv2.COLOR_BGR2GRAY)
-        gray_r = cv2.cvtColor(small_r, cv2.COLOR_BGR2GRAY)
-        gray_l = self._clahe.apply(gray_l)
-        gray_r = self._clahe.apply(gray_r)
+        gray_l, gray_r = self._per_eye(
+            lambda: self._preprocess(frame_l, s, 0),
+            lambda: self._preprocess(frame_r, s, 1))
 
         # --- Primary: Epipolar regression ---
         result = self._epipolar_align(gray_l, gray_r, scale=s)
@@ -230,6 +260,33 @@ class StereoAligner:
 
         return self.result
 
+    def _preprocess(self, frame: np.ndarray, s: float, eye: int) -> np.ndarray:
+        """BGR frame → grey → ×*s* → CLAHE, through per-eye reused buffers."""
+        h, w = frame.shape[:2]
+        bufs = self._gray_bufs[eye]
+        if bufs is None or bufs[0].shape != (h, w):
+            sw, sh = (round(w * s), round(h * s)) if s < 1.0 else (w, h)
+            bufs = (np.empty((h, w), np.uint8), np.empty((sh, sw), np.uint8))
+            self._gray_bufs[eye] = bufs
+        gray, small = bufs
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+        if s < 1.0:
+            cv2.resize(gray, small.shape[::-1], dst=small,
+                       interpolation=cv2.INTER_AREA)
+        else:
+            small = gray
+        clahe = self._clahe if eye == 0 else self._clahe_r
+        return clahe.apply(small, dst=small)
+
+    def _per_eye(
+        self, fn_l: Callable[[], _T], fn_r: Callable[[], _T]
+    ) -> Tuple[_T, _T]:
+        """Run *fn_r* on the worker thread and *fn_l* here, concurrently."""
+        if self._pool is None:
+            return fn_l(), fn_r()
+        fut_r = self._pool.submit(fn_r)
+        return fn_l(), fut_r.result()
+
     def warp_pair(
         self,
         frame_l: np.ndarray,
@@ -299,13 +356,19 @@ class StereoAligner:
 
         Theil-Sen gives a robust estimate of both parameters.
         """
-        kp_l, des_l = self._sift.detectAndCompute(gray_l, None)
-        kp_r, des_r = self._sift.detectAndCompute(gray_r, None)
+        sift = self._sift
+        (kp_l, des_l), (kp_r, des_r) = self._per_eye(
+            lambda: sift.detectAndCompute(gray_l, None),
+            lambda: sift.detectAndCompute(gray_r, None))
 
         if des_l is None or des_r is None:
             return None
         if len(kp_l) < 10 or len(kp_r) < 10:
             return None
+        # SIFT descriptors are integers in 0…255 stored as float32, so
+        # uint8 is lossless and a quarter of the bytes to match over
+        des_l = des_l.astype(np.uint8)
+        des_r = des_r.astype(np.uint8)
 
         # --- Cross-checked matching ---
         matches = self._cross_check_match(des_l, des_r)
@@ -316,8 +379,11 @@ class StereoAligner:
                 return None
 
         inv_s = 1.0 / scale
-        pts_l = np.float32([kp_l[m[0]].pt for m in matches]) * inv_s
-        pts_r = np.float32([kp_r[m[1]].pt for m in matches]) * inv_s
+        # Keypoint coordinates as (N, 2) arrays, gathered by match index
+        xy_l = cv2.KeyPoint_convert(kp_l)
+        xy_r = cv2.KeyPoint_convert(kp_r)
+        pts_l = xy_l[matches[:, 0]] * np.float32(inv_s)
+        pts_r = xy_r[matches[:, 1]] * np.float32(inv_s)
         n_after_ratio = len(matches)
 
         # --- Stereo spatial filter ---
@@ -366,58 +432,72 @@ class StereoAligner:
 
     def _cross_check_match(
         self, des_l: np.ndarray, des_r: np.ndarray
-    ) -> list:
+    ) -> np.ndarray:
         """L→R and R→L matching; keep only mutual best matches.
 
         Cross-checking eliminates most wrong matches that pass the ratio
-        test in one direction but fail the symmetric check.
+        test in one direction but fail the symmetric check.  Only the
+        right descriptors that survived the L→R ratio test can form a
+        mutual pair, so the R→L direction only searches that subset.
+
+        Returns an ``(N, 2)`` int array of ``(left_idx, right_idx)`` rows.
         """
         try:
-            raw_lr = self._matcher.knnMatch(des_l, des_r, k=2)
-            raw_rl = self._matcher.knnMatch(des_r, des_l, k=2)
+            lr_q, lr_t = self._ratio_filter(*self._knn_match(des_l, des_r))
         except cv2.error:
-            return []
-
-        ratio = self.cfg.match_ratio
-
-        good_lr: dict[int, int] = {}
-        for pair in raw_lr:
-            if len(pair) == 2:
-                m, n = pair
-                if m.distance < ratio * n.distance:
-                    good_lr[m.queryIdx] = m.trainIdx
-
-        good_rl: dict[int, int] = {}
-        for pair in raw_rl:
-            if len(pair) == 2:
-                m, n = pair
-                if m.distance < ratio * n.distance:
-                    good_rl[m.queryIdx] = m.trainIdx
+            return np.empty((0, 2), np.intp)
+        if len(lr_t) == 0:
+            return np.empty((0, 2), np.intp)
+
+        # R→L: ratio-tested best left match for each candidate right one
+        cand = np.unique(lr_t)
+        rl_q, rl_t = self._ratio_filter(*self._knn_match(des_r[cand], des_l))
+
+        # Best left index for every right descriptor (-1 = none); a pair
+        # is mutual when the R→L match points back at its query
+        rl_map = np.full(len(des_r), -1, np.intp)
+        rl_map[cand[rl_q]] = rl_t
+        mutual = rl_map[lr_t] == lr_q
+        return np.stack((lr_q[mutual], lr_t[mutual]), axis=1)
+
+    def _knn_match(
+        self, des_q: np.ndarray, des_t: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Two nearest *des_t* rows for every *des_q* row (uint8 SIFT).
 
-        # Keep only mutual matches
-        mutual = []
-        for l_idx, r_idx in good_lr.items():
-            if good_rl.get(r_idx) == l_idx:
-                mutual.append((l_idx, r_idx))
+        Exact brute force on the uint8 descriptors (integer SIMD, no
+        index to build) up to ``_BF_MAX_PAIRS`` comparisons; a FLANN
+        KD-tree on float copies beyond that, where O(N·M) stops paying.
 
-        return mutual
+        Returns ``(indices, squared_distances)``, both ``(N, 2)``.
+        """
+        if len(des_q) * len(des_t) <= self._BF_MAX_PAIRS:
+            dtype = cv2.CV_32S if des_q.dtype == np.uint8 else cv2.CV_32F
+            dist2, idx = cv2.batchDistance(
+                des_q, des_t, dtype, normType=cv2.NORM_L2SQR, K=2)
+            return idx, dist2
+        index = cv2.flann.Index(des_t.astype(np.float32), self._flann_index_params)
+        return index.knnSearch(des_q.astype(np.float32), 2,
+                               params=self._flann_search_params)
+
+    def _ratio_filter(
+        self, idx: np.ndarray, dist2: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Lowe ratio test over knn results → ``(query, train)`` arrays."""
+        # Distances are squared L2, so compare against ratio²
+        good = dist2[:, 0] < self.cfg.match_ratio ** 2 * dist2[:, 1]
+        return np.flatnonzero(good), idx[good, 0].astype(np.intp)
 
     def _one_way_match(
         self, des_l: np.ndarray, des_r: np.ndarray
-    ) -> list:
+    ) -> np.ndarray:
         """Standard one-way ratio-tested matching (less strict fallback)."""
         try:
-            raw = self._matcher.knnMatch(des_l, des_r, k=2)
+            lr_q, lr_t = self._ratio_filter(*self._knn_match(des_l, des_r))
         except cv2.error:
-            return []
+            return np.empty((0, 2), np.intp)
 
-        matches = []
-        for pair in raw:
-            if len(pair) == 2:
-                m, n = pair
-                if m.distance < self.cfg.match_ratio * n.distance:
-                    matches.append((m.queryIdx, m.trainIdx))
-        return matches
+        return np.stack((lr_q, lr_t), axis=1)
 
     # ------------------------------------------------------------------
     # Spatial distribution
@@ -437,18 +517,25 @@ class StereoAligner:
         cell_w = self.frame_w / g
         cell_h = self.frame_h / g
 
-        buckets: dict[tuple, list] = {}
-        for i in range(len(pts_l)):
-            gx = min(int(pts_l[i, 0] / cell_w), g - 1)
-            gy = min(int(pts_l[i, 1] / cell_h), g - 1)
-            buckets.setdefault((gx, gy), []).append(i)
-
-        max_per = max(6, len(pts_l) // (g * g) + 1)
-        sel = []
-        for indices in buckets.values():
-            sel.extend(indices[:max_per])
-
-        idx = np.array(sel)
+        n = len(pts_l)
+        gx = np.minimum((pts_l[:, 0].astype(np.float64) / cell_w).astype(np.intp), g - 1)
+        gy = np.minimum((pts_l[:, 1].astype(np.float64) / cell_h).astype(np.intp), g - 1)
+        cell = gx + g * gy
+
+        # Group by cell (stable, so each group keeps match order) and
+        # rank every match within its cell
+        order = np.argsort(cell, kind="stable")
+        cs = cell[order]
+        starts = np.flatnonzero(np.r_[True, cs[1:] != cs[:-1]])
+        counts = np.diff(np.r_[starts, n])
+        rank = np.arange(n) - np.repeat(starts, counts)
+
+        max_per = max(6, n // (g * g) + 1)
+        keep = rank < max_per
+        idx = order[keep]
+        # Cells in order of first appearance, as the per-cell caps apply
+        first = np.repeat(order[starts], counts)[keep]
+        idx = idx[np.lexsort((idx, first))]
         return pts_l[idx], pts_r[idx]
 
     # ------------------------------------------------------------------
@@ -513,8 +600,11 @@ class StereoAligner:
         ordinary least-squares and comparably robust to RANSAC, but
         deterministic and parameter-free.
 
-        For large *n* the all-pairs computation is O(n²); we switch to
-        random sub-sampling above 200 points to keep runtime bounded.
+        For large *n* the all-pairs computation is O(n²); above 200 points
+        we sort by x and only pair each point with its neighbours at a
+        handful of geometrically spaced rank offsets — O(n log n) time and
+        O(n) memory, deterministic, and still spanning short to long
+        baselines.
 
         Returns ``(slope, intercept, rms_residual)``.
         """
@@ -525,27 +615,21 @@ class StereoAligner:
             # --- Exact: all unique pairs (i < j) via vectorised indices ---
             ii, jj = np.triu_indices(n, k=1)
             dx = x[jj] - x[ii]
+            dy = y[jj] - y[ii]
             valid = np.abs(dx) > min_sep
-            if valid.sum() < 3:
-                slope = 0.0          # not enough x-spread → assume no rotation
-            else:
-                slopes = (y[jj[valid]] - y[ii[valid]]) / dx[valid]
-                slope = float(np.median(slopes))
         else:
-            # --- Sub-sampled: random pairs ---
-            rng = np.random.default_rng(42)
-            n_pairs = min(50_000, n * (n - 1) // 2)
-            ai = rng.integers(0, n, n_pairs)
-            bi = rng.integers(0, n, n_pairs)
-            keep = ai != bi
-            ai, bi = ai[keep], bi[keep]
-            dx = x[bi] - x[ai]
-            valid = np.abs(dx) > min_sep
-            if valid.sum() < 3:
-                slope = 0.0
-            else:
-                slopes = (y[bi[valid]] - y[ai[valid]]) / dx[valid]
-                slope = float(np.median(slopes[valid]))
+            # --- Sorted rank-offset pairs ---
+            order = np.argsort(x)
+            xs, ys = x[order], y[order]
+            offsets = np.unique(np.geomspace(1, n - 1, num=16).astype(np.intp))
+            dx = np.concatenate([xs[k:] - xs[:-k] for k in offsets])
+            dy = np.concatenate([ys[k:] - ys[:-k] for k in offsets])
+            valid = dx > min_sep          # sorted → dx ≥ 0
+
+        if valid.sum() < 3:
+            slope = 0.0          # not enough x-spread → assume no rotation
+        else:
+            slope = float(np.median(dy[valid] / dx[valid]))
 
         intercepts = y - slope * x
         intercept = float(np.median(intercepts))
@@ -570,10 +654,17 @@ class StereoAligner:
         """
         inv_s = 1.0 / scale
 
+        h, w = gray_l.shape[:2]
+        win = self._phase_window
+        if win is None or win.shape != (h, w):
+            win = cv2.createHanningWindow((w, h), cv2.CV_32F)
+            self._phase_window = win
+
         try:
             shift, response = cv2.phaseCorrelate(
-                gray_l.astype(np.float64),
-                gray_r.astype(np.float64),
+                gray_l.astype(np.float32),
+                gray_r.astype(np.float32),
+                win,
             )
         except cv2.error:
             return None
@@ -652,20 +743,28 @@ class StereoAligner:
         self._compute_overlap_mask()
 
     def _compute_overlap_mask(self):
-        """Precompute the region where BOTH warped images have valid pixels."""
+        """Precompute the region where BOTH warped images have valid pixels.
+
+        Each warped image is valid inside its source rectangle mapped
+        through the forward affine, so the overlap is the intersection
+        of two convex quads -- rasterised directly instead of warping
+        two full-frame all-255 images.
+        """
         h, w = self.frame_h, self.frame_w
-        ones = np.full((h, w), 255, dtype=np.uint8)
-
-        mask_l = cv2.warpAffine(
-            ones, self._warp_l, (w, h),
-            flags=cv2.INTER_NEAREST,
-            borderMode=cv2.BORDER_CONSTANT, borderValue=0)
-        mask_r = cv2.warpAffine(
-            ones, self._warp_r, (w, h),
-            flags=cv2.INTER_NEAREST,
-            borderMode=cv2.BORDER_CONSTANT, borderValue=0)
-
-        overlap = cv2.bitwise_and(mask_l, mask_r)
+        # Pixel-edge corners: INTER_NEAREST samples src in [-0.5, w-0.5).
+        corners = np.float32([
+            [-0.5, -0.5], [w - 0.5, -0.5],
+            [w - 0.5, h - 0.5], [-0.5, h - 0.5],
+        ]).reshape(1, 4, 2)
+        quad_l = cv2.transform(corners, self._warp_l).reshape(4, 2)
+        quad_r = cv2.transform(corners, self._warp_r).reshape(4, 2)
+        area, poly = cv2.intersectConvexConvex(quad_l, quad_r)
+
+        overlap = np.zeros((h, w), dtype=np.uint8)
+        if poly is not None and area > 0:
+            # 8 fractional bits keep the sub-pixel vertex positions.
+            pts = np.round(poly.reshape(-1, 2) * 256).astype(np.int32)
+            cv2.fillConvexPoly(overlap, pts, 255, cv2.LINE_8, 8)
         kernel = np.ones((5, 5), np.uint8)
         self._overlap_mask = cv2.erode(overlap, kernel, iterations=1)
         self._overlap_mask_3ch = cv2.cvtColor(
@@ -753,6 +852,7 @@ class StereoAligner:
         clip_limit = 3.0 * zoom_level
         tile_grid_size = (int(8 * zoom_level), int(8 * zoom_level))
         self._clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
+        self._clahe_r = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
         print(f"CLAHE parameters adjusted: clip_limit={clip_limit}, tile_grid_size={tile_grid_size}")
 
     def optimize_sift_features(self, zoom_level: float):
@@ -765,7 +865,6 @@ class StereoAligner:
         """Dynamically adjust FLANN matcher parameters based on zoom level."""
         trees = max(1, int(5 * zoom_level))
         checks = max(10, int(80 * zoom_level))
-        index_params = dict(algorithm=1, trees=trees)   # FLANN_INDEX_KDTREE
-        search_params = dict(checks=checks)
-        self._matcher = cv2.FlannBasedMatcher(index_params, search_params)
+        self._flann_index_params = dict(algorithm=1, trees=trees)   # FLANN_INDEX_KDTREE
+        self._flann_search_params = dict(checks=checks)
         print(f"FLANN parameters adjusted: trees={trees}, checks={checks}")
@@ -36,6 +36,13 @@ import time
 from .config import StereoCfg
 
 
+def _compose_affine(outer: np.ndarray, inner: np.ndarray) -> np.ndarray:
+    """2 × 3 affine equivalent to applying *inner* then *outer*."""
+    m = outer[:, :2] @ inner
+    m[:, 2] += outer[:, 2]
+    return m.astype(np.float32)
+
+
 class StereoProcessor:
     """Stateful stereo processor that tracks the current zoom level and
     convergence offset."""
@@ -58,6 +65,15 @@ class StereoProcessor:
         self._eye_l = self._sbs[:, :eye_width]       # view into left half
         self._eye_r = self._sbs[:, eye_width:]        # view into right half
 
+        # (source mask, zoom affine bytes, mask warped to eye size) – see
+        # process_pair_affine()
+        self._eye_mask_cache: tuple | None = None
+
+        # Optional OpenCL (T-API) path for the per-eye warp / resize
+        self.use_opencl = bool(getattr(cfg, "use_opencl", False)) and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+
     # ------------------------------------------------------------------
     # Public helpers to drive from the input handler
     # ------------------------------------------------------------------
@@ -195,9 +211,8 @@ class StereoProcessor:
         eye_r = self.process_eye(frame_r, "right", dst=self._eye_r)
         return eye_l, eye_r, self._sbs
 
-    def process_pair_joint_zoom(self, frame_l: np.ndarray, frame_r: np.ndarray):
-        """Process both eyes using a joint zoom center (horizontal and vertical percent)."""
-        h, w = frame_l.shape[:2]
+    def _joint_crop(self, w: int, h: int) -> tuple[int, int, int, int]:
+        """Joint-zoom crop rectangle ``(x1, y1, x2, y2)`` for a ``w × h`` frame."""
         roi_w = int(w / self.zoom)
         roi_h = int(h / self.zoom)
         # Center as percent (0-100)
@@ -210,12 +225,84 @@ class StereoProcessor:
         y2 = min(y1 + roi_h, h)
         x1 = max(x2 - roi_w, 0)
         y1 = max(y2 - roi_h, 0)
+        return x1, y1, x2, y2
+
+    def process_pair_joint_zoom(self, frame_l: np.ndarray, frame_r: np.ndarray):
+        """Process both eyes using a joint zoom center (horizontal and vertical percent)."""
+        h, w = frame_l.shape[:2]
+        x1, y1, x2, y2 = self._joint_crop(w, h)
         crop_l = frame_l[y1:y2, x1:x2]
         crop_r = frame_r[y1:y2, x1:x2]
-        eye_l = cv2.resize(crop_l, (self.eye_w, self.eye_h), interpolation=cv2.INTER_LINEAR)
-        eye_r = cv2.resize(crop_r, (self.eye_w, self.eye_h), interpolation=cv2.INTER_LINEAR)
-        self._eye_l[:] = eye_l
-        self._eye_r[:] = eye_r
+        # Resize straight into the SBS halves – no temporaries, no copy-back
+        size = (self.eye_w, self.eye_h)
+        if self.use_opencl:
+            # T-API: resize on the device, download into the SBS half
+            for crop, dst in ((crop_l, self._eye_l), (crop_r, self._eye_r)):
+                out = cv2.resize(cv2.UMat(np.ascontiguousarray(crop)), size,
+                                 interpolation=cv2.INTER_LINEAR)
+                np.copyto(dst, out.get())
+        else:
+            cv2.resize(crop_l, size, dst=self._eye_l, interpolation=cv2.INTER_LINEAR)
+            cv2.resize(crop_r, size, dst=self._eye_r, interpolation=cv2.INTER_LINEAR)
+        return self._eye_l, self._eye_r, self._sbs
+
+    def joint_zoom_affine(self, w: int, h: int) -> np.ndarray:
+        """2 × 3 affine mapping frame pixels to eye pixels for the joint zoom.
+
+        Equivalent to cropping with :meth:`_joint_crop` and resizing to
+        the eye size (same pixel-centre convention as ``cv2.resize``).
+        """
+        x1, y1, x2, y2 = self._joint_crop(w, h)
+        sx = self.eye_w / (x2 - x1)
+        sy = self.eye_h / (y2 - y1)
+        return np.float32([
+            [sx, 0.0, (0.5 - x1) * sx - 0.5],
+            [0.0, sy, (0.5 - y1) * sy - 0.5],
+        ])
+
+    def process_pair_affine(
+        self,
+        frame_l: np.ndarray,
+        frame_r: np.ndarray,
+        pre_l: np.ndarray,
+        pre_r: np.ndarray,
+        mask: np.ndarray | None = None,
+    ):
+        """Joint zoom with a per-eye 2 × 3 pre-transform folded in.
+
+        ``pre_l`` / ``pre_r`` (e.g. the stereo alignment warps) are
+        composed with :meth:`joint_zoom_affine` so each eye is produced
+        by a single ``warpAffine`` straight into its SBS half, instead of
+        a full-frame warp followed by a crop + resize.  ``mask`` is an
+        optional 3-channel frame-space mask (the alignment overlap) that
+        is warped to eye space once per zoom state and AND-ed in.
+        """
+        h, w = frame_l.shape[:2]
+        zoom = self.joint_zoom_affine(w, h)
+        size = (self.eye_w, self.eye_h)
+        for frame, pre, dst in ((frame_l, pre_l, self._eye_l),
+                                (frame_r, pre_r, self._eye_r)):
+            m = _compose_affine(zoom, pre)
+            if self.use_opencl:
+                # T-API: warp on the device, download into the SBS half
+                out = cv2.warpAffine(cv2.UMat(frame), m, size,
+                                     flags=cv2.INTER_LINEAR,
+                                     borderMode=cv2.BORDER_CONSTANT,
+                                     borderValue=(0, 0, 0))
+                np.copyto(dst, out.get())
+            else:
+                cv2.warpAffine(frame, m, size, dst=dst, flags=cv2.INTER_LINEAR,
+                               borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0))
+
+        if mask is not None:
+            key = zoom.tobytes()
+            cached = self._eye_mask_cache
+            if cached is None or cached[0] is not mask or cached[1] != key:
+                eye_mask = cv2.warpAffine(mask, zoom, size, flags=cv2.INTER_NEAREST,
+                                          borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+                cached = self._eye_mask_cache = (mask, key, eye_mask)
+            cv2.bitwise_and(self._eye_l, cached[2], dst=self._eye_l)
+            cv2.bitwise_and(self._eye_r, cached[2], dst=self._eye_r)
         return self._eye_l, self._eye_r, self._sbs
 
     def smooth_zoom_transition(self, target_zoom: float, steps: int = 10):
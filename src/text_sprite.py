@@ -0,0 +1,53 @@
+"""Cached sprites for fixed-font overlay text (HUD, calibration labels).
+
+``cv2.putText`` re-walks the Hershey glyph strokes on every call.  The
+overlay strings change at most a few times per second, so each
+``(text, scale, colour, thickness)`` is rasterised once into an alpha
+mask + premultiplied foreground and alpha-blended on later frames.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import cv2
+import numpy as np
+
+
+@functools.lru_cache(maxsize=64)
+def _hershey_sprite(
+    text: str, scale: float, color: tuple[int, int, int], thickness: int
+) -> tuple[int, int, np.ndarray, np.ndarray]:
+    """Rasterise a Hershey ``cv2.putText`` string once into a blendable sprite.
+
+    Returns ``(dx, dy, fg, inv_alpha)``: the sprite's offset from the
+    putText origin, the premultiplied BGR foreground and ``255 - alpha``
+    (both uint8, 3-channel).  Not to be confused with the Pillow-based
+    ``annotation._text_sprite``, whose planes are float32 ``1 - alpha``.
+    """
+    (tw, th), baseline = cv2.getTextSize(
+        text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+    pad = thickness + 1
+    mask = np.zeros((th + baseline + 2 * pad, tw + 2 * pad), dtype=np.uint8)
+    cv2.putText(mask, text, (pad, th + pad), cv2.FONT_HERSHEY_SIMPLEX,
+                scale, 255, thickness, cv2.LINE_AA)
+    alpha = cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR)
+    fg = cv2.multiply(alpha, np.full_like(alpha, color), scale=1 / 255)
+    return -pad, -th - pad, fg, 255 - alpha
+
+
+def put_text(img: np.ndarray, text: str, org: tuple[int, int],
+             scale: float, color: tuple[int, int, int], thickness: int = 1):
+    """Drop-in for anti-aliased ``cv2.putText`` using a cached sprite."""
+    dx, dy, fg, inv_alpha = _hershey_sprite(text, scale, color, thickness)
+    h, w = img.shape[:2]
+    x0, y0 = org[0] + dx, org[1] + dy
+    sh, sw = fg.shape[:2]
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x0 + sw, w), min(y0 + sh, h)
+    if cx1 <= cx0 or cy1 <= cy0:
+        return
+    sy = slice(cy0 - y0, cy1 - y0)
+    sx = slice(cx0 - x0, cx1 - x0)
+    roi = img[cy0:cy1, cx0:cx1]
+    cv2.add(cv2.multiply(roi, inv_alpha[sy, sx], scale=1 / 255), fg[sy, sx], dst=roi)
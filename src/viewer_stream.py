@@ -18,6 +18,7 @@ Control API:
 
 from __future__ import annotations
 
+import os
 import queue
 import threading
 import time
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
     from src.app import PiccoloApp
 from .config import StreamCfg
 from .annotation import AnnotationOverlay
+from .camera import pin_current_thread
 
 # ---------------------------------------------------------------------------
 # Inline HTML template – full control panel + live stream
@@ -921,6 +923,51 @@ fetch('/api/annotations/list').then(r => r.json()).then(d => {
 """
 
 
+class _FrameRing:
+    """Single-producer ring of pre-allocated frame slots.
+
+    The main loop copies each frame into the next slot and then bumps
+    ``_seq`` (a single attribute store, atomic under the GIL) to publish
+    it.  Readers take a zero-copy view of the newest slot and, once done
+    with it, call :meth:`still_valid` to check the producer has not
+    lapped them and started overwriting that slot.  No lock is taken on
+    either side.  ``new_frame`` is set on every publish so a consumer can
+    block until there is something to read instead of polling.
+    """
+
+    def __init__(self, n_slots: int = 4):
+        self._n = n_slots
+        self._slots: list[np.ndarray] = []
+        self._seq: int = 0    # frames published; newest is slot (seq-1) % n
+        self.new_frame = threading.Event()
+
+    def push(self, frame: np.ndarray):
+        """Copy *frame* into the next slot and publish it (producer only)."""
+        slots = self._slots
+        if not slots or slots[0].shape != frame.shape:
+            # (Re)allocate on first frame / resolution change.  Readers
+            # holding a view of an old slot keep it alive until done.
+            slots = self._slots = [np.empty_like(frame) for _ in range(self._n)]
+        np.copyto(slots[self._seq % self._n], frame)
+        self._seq += 1
+        self.new_frame.set()
+
+    def latest(self) -> tuple[int, np.ndarray | None]:
+        """Return ``(seq, view)`` of the newest frame, or ``(0, None)``."""
+        seq, slots = self._seq, self._slots
+        if seq == 0:
+            return 0, None
+        return seq, slots[(seq - 1) % len(slots)]
+
+    def still_valid(self, seq: int) -> bool:
+        """True if the frame returned with *seq* has not been overwritten.
+
+        The producer starts writing that slot again once it is
+        publishing frame ``seq - 1 + n``.
+        """
+        return self._seq - seq < self._n - 1
+
+
 class ViewerStream:
     """MJPEG streaming server that runs in a background thread."""
 
@@ -929,20 +976,33 @@ class ViewerStream:
         self.app = app
         self.cam_l = app.cam_l
         self.cam_r = app.cam_r
-        self._frame_sbs: np.ndarray | None = None
-        self._frame_left: np.ndarray | None = None
-        self._frame_right: np.ndarray | None = None
+        # Latest SBS frames; the eye streams are views of its halves
+        self._ring = _FrameRing()
+        self._eye_w: int = 0
         self._lock = threading.Lock()
         self._thread: threading.Thread | None = None
         self._client_count: int = 0  # track active MJPEG clients
 
+        # JPEG encoding runs on one dedicated thread for all clients:
+        # ``_clients`` counts viewers per stream kind, ``_jpegs`` holds
+        # the newest ``(seq, jpeg bytes)`` per kind, guarded by
+        # ``_jpeg_cond`` which is notified after every encode round.
+        self._clients: dict[str, int] = {}
+        self._jpegs: dict[str, tuple[int, bytes]] = {}
+        self._jpeg_cond = threading.Condition()
+        self._encoder_thread: threading.Thread | None = None
+
         # Annotation overlay (shared with app.py via .annotations)
-        self.annotations = AnnotationOverlay()
+        self.annotations = AnnotationOverlay(
+            use_opencl=bool(getattr(app.cfg.stereo, "use_opencl", False)))
 
         self._app = self._create_app()
 
-        # Command queue: web UI pushes action names, main loop drains
+        # Command queue: web UI pushes action names, main loop drains.
+        # ``wake`` is set on every push so the main loop, which sleeps on
+        # it between camera frames, reacts immediately.
         self._cmd_queue: queue.Queue[str] = queue.Queue()
+        self.wake: threading.Event | None = None
 
         # Status dict updated by the main loop for the web UI to read
         self._status: dict = {}
@@ -959,26 +1019,18 @@ class ViewerStream:
         right: np.ndarray | None = None,
     ):
         # Must copy – the caller's buffers are pre-allocated and get
-        # overwritten on the next frame.  Without a copy the MJPEG
-        # encoder thread reads a buffer that the main thread is mutating
-        # concurrently, producing corrupt / blank frames.
+        # overwritten on the next frame.  The copy goes into a ring slot
+        # (no allocation, no lock); encoder threads read the slot in
+        # place.  ``left`` / ``right`` are the two halves of ``sbs``, so
+        # only their split point is recorded.
         #
-        # When no browser clients are connected we still store a cheap
-        # reference so the first client to connect sees a frame instantly
-        # instead of waiting for the next main-loop iteration.
-        if self._client_count <= 0:
-            # No clients: just keep a reference (no expensive copy)
-            self._frame_sbs = sbs
-            self._frame_left = left
-            self._frame_right = right
+        # When no browser clients are connected nothing is copied at
+        # all; the first client picks up the next frame.
+        if self._client_count <= 0 or sbs is None:
             return
-        with self._lock:
-            if sbs is not None:
-                self._frame_sbs = sbs.copy()
-            if left is not None:
-                self._frame_left = left.copy()
-            if right is not None:
-                self._frame_right = right.copy()
+        if left is not None:
+            self._eye_w = left.shape[1]
+        self._ring.push(sbs)
 
     # ------------------------------------------------------------------
     # Command queue (web UI → main loop)
@@ -987,6 +1039,12 @@ class ViewerStream:
     def push_command(self, action_name: str):
         """Push a command from the web UI (thread-safe)."""
         self._cmd_queue.put_nowait(action_name)
+        if self.wake is not None:
+            self.wake.set()
+
+    @property
+    def has_commands(self) -> bool:
+        return not self._cmd_queue.empty()
 
     def drain_commands(self) -> list[str]:
         """Drain all pending commands (called from main loop)."""
@@ -1203,108 +1261,158 @@ class ViewerStream:
         return app
 
     def _generate(self, which: str):
-        """MJPEG generator for Flask streaming response."""
-        self._client_count += 1
+        """MJPEG generator for Flask streaming response.
+
+        Only waits for the encoder thread and sends its bytes, so N
+        viewers of the same stream cost one encode, not N.
+        """
+        with self._jpeg_cond:
+            self._clients[which] = self._clients.get(which, 0) + 1
+            self._client_count += 1
+            if self._encoder_thread is None:
+                self._encoder_thread = threading.Thread(
+                    target=self._encode_loop, daemon=True, name="stream-encoder")
+                self._encoder_thread.start()
         try:
+            last_seq = 0
             while True:
-                # ── Grab frame(s) under lock ──
-                with self._lock:
-                    if which == "anaglyph":
-                        raw_l = self._frame_left
-                        raw_r = self._frame_right
-                        left = raw_l.copy() if raw_l is not None else None
-                        right = raw_r.copy() if raw_r is not None else None
-                        frame = None
-                    elif which == "annotated":
-                        raw = self._frame_sbs
-                        frame = raw.copy() if raw is not None else None
-                        if frame is not None:
-                            self.annotations.render_on_sbs(frame)
-                    elif which == "fused_annotated":
-                        raw_l = self._frame_left
-                        raw_r = self._frame_right
-                        if raw_l is not None and raw_r is not None:
-                            frame = self.annotations.render_on_fused(raw_l, raw_r)
-                        else:
-                            frame = None
-                    else:
-                        if which == "sbs":
-                            raw = self._frame_sbs
-                        elif which == "left":
-                            raw = self._frame_left
-                        else:
-                            raw = self._frame_right
-                        # Snapshot: copy to avoid race with main-loop buffer.
-                        frame = raw.copy() if raw is not None else None
-
-                # ── Compose anaglyph outside the lock ──
-                if which == "anaglyph":
-                    if left is None or right is None:
-                        time.sleep(0.05)
+                with self._jpeg_cond:
+                    if not self._jpeg_cond.wait_for(
+                        lambda: self._jpegs.get(which, (0,))[0] > last_seq,
+                        timeout=1.0,
+                    ):
                         continue
-                    # True anaglyph: left → red, right → cyan (grayscale)
-                    frame = np.empty_like(left)
-                    lg = cv2.cvtColor(left, cv2.COLOR_BGR2GRAY)
-                    rg = cv2.cvtColor(right, cv2.COLOR_BGR2GRAY)
-                    frame[:, :, 2] = lg   # Red   ← left eye
-                    frame[:, :, 1] = rg   # Green ← right eye
-                    frame[:, :, 0] = rg   # Blue  ← right eye
-
-                if frame is None:
-                    time.sleep(0.05)
-                    continue
-
-                ok, jpeg = cv2.imencode(
-                    ".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.cfg.jpeg_quality]
-                )
-                if not ok:
-                    time.sleep(0.02)
-                    continue
-
+                    last_seq, jpeg = self._jpegs[which]
                 yield (
                     b"--frame\r\n"
                     b"Content-Type: image/jpeg\r\n\r\n"
-                    + jpeg.tobytes()
+                    + jpeg
                     + b"\r\n"
                 )
-                # Cap stream frame-rate to ~30 fps to save bandwidth
-                time.sleep(0.033)
         finally:
-            self._client_count -= 1
+            with self._jpeg_cond:
+                self._clients[which] -= 1
+                self._client_count -= 1
+
+    def _encode_loop(self):
+        """Encode the newest ring frame once per watched stream kind.
+
+        ``cv2.imencode`` releases the GIL, so this runs in parallel with
+        the main loop.  With ``cameras.pin_threads`` the app may reserve
+        a core for it, away from the grab threads and render loop.
+        """
+        cpu = getattr(self.app, "encoder_cpu", None)
+        if cpu is not None:
+            pin_current_thread({cpu})
+        params = [cv2.IMWRITE_JPEG_QUALITY, self.cfg.jpeg_quality]
+        last_seq = 0
+        while True:
+            # Sleep until the main loop publishes a frame (it only does
+            # while someone is watching)
+            if not self._ring.new_frame.wait(timeout=1.0):
+                continue
+            self._ring.new_frame.clear()
+            t0 = time.monotonic()
+            try:
+                last_seq = self._encode_round(params, last_seq)
+            except Exception as exc:
+                # One bad frame must not kill streaming for every viewer
+                print(f"[stream] Encoder error: {exc!r}")
+            # Cap stream frame-rate to ~30 fps to save bandwidth
+            time.sleep(max(0.0, 0.033 - (time.monotonic() - t0)))
+
+    def _encode_round(self, params: list, last_seq: int) -> int:
+        """Encode the newest ring frame for every watched kind.
+
+        Returns the sequence number of the frame handled, or *last_seq*
+        if there was nothing new to do.
+        """
+        seq, raw = self._ring.latest()
+        with self._jpeg_cond:
+            kinds = [k for k, n in self._clients.items() if n > 0]
+        if raw is None or seq == last_seq or not kinds:
+            return last_seq
+        # Take a private copy so a slow round (several 1080p kinds) can't
+        # be torn by the producer lapping the ring; only the copy itself
+        # has to beat it.
+        raw = raw.copy()
+        if not self._ring.still_valid(seq):
+            return last_seq
+        eye_w = self._eye_w or raw.shape[1] // 2
+        encoded = {}
+        for which in kinds:
+            ok, jpeg = cv2.imencode(".jpg", self._compose(which, raw, eye_w), params)
+            if ok:
+                encoded[which] = (seq, jpeg.tobytes())
+        if encoded:
+            with self._jpeg_cond:
+                self._jpegs.update(encoded)
+                self._jpeg_cond.notify_all()
+        return seq
+
+    def _compose(self, which: str, raw: np.ndarray, eye_w: int) -> np.ndarray:
+        """Build the frame for stream kind *which* from an SBS ring slot."""
+        if which == "anaglyph":
+            # True anaglyph: left → red, right → cyan (grayscale)
+            lg = cv2.cvtColor(raw[:, :eye_w], cv2.COLOR_BGR2GRAY)
+            rg = cv2.cvtColor(raw[:, eye_w:], cv2.COLOR_BGR2GRAY)
+            frame = np.empty((raw.shape[0], eye_w, 3), dtype=np.uint8)
+            frame[:, :, 2] = lg   # Red   ← left eye
+            frame[:, :, 1] = rg   # Green ← right eye
+            frame[:, :, 0] = rg   # Blue  ← right eye
+            return frame
+        if which == "annotated":
+            frame = raw.copy()
+            self.annotations.render_on_sbs(frame)
+            return frame
+        if which == "fused_annotated":
+            return self.annotations.render_on_fused(raw[:, :eye_w], raw[:, eye_w:])
+        if which == "sbs":
+            return raw
+        if which == "left":
+            return raw[:, :eye_w]
+        return raw[:, eye_w:]
 
     def generate_fused_3d(self):
         """Generate frames for the Fused 3D simulation (optimized for speed and smoothness)."""
         import time
         while True:
             t_start = time.time()
+            # Only snapshot the camera references under the lock; the
+            # read / warp / blend / encode below run outside it so one
+            # client never stalls another for a whole frame's work.
             with self._lock:
-                if self.app.cam_l is None or self.app.cam_r is None:
-                    time.sleep(0.01)
-                    continue
-
-                frame_l = self.app.cam_l.read()
-                frame_r = self.app.cam_r.read()
-
-                if frame_l is None or frame_r is None:
-                    time.sleep(0.01)
-                    continue
-
-                # Apply horizontal offset from slider to right frame
-                rows, cols, _ = frame_r.shape
-                offset = getattr(self.cfg, 'alignment_offset', 0)
-                translation_matrix = np.float32([[1, 0, offset], [0, 1, 0]])
-                aligned_frame_r = cv2.warpAffine(frame_r, translation_matrix, (cols, rows), borderMode=cv2.BORDER_REPLICATE)
-
-                # Fuse frames in color (simple average)
-                fused_frame = cv2.addWeighted(frame_l, 0.5, aligned_frame_r, 0.5, 0)
-
-                # Encode the frame as JPEG
-                success, buffer = cv2.imencode('.jpg', fused_frame)
-                if not success:
-                    time.sleep(0.01)
-                    continue
-
-                frame = buffer.tobytes()
+                cam_l, cam_r = self.app.cam_l, self.app.cam_r
+            if cam_l is None or cam_r is None:
+                time.sleep(0.01)
+                continue
+
+            # Private copies: this runs unpaced on a Flask thread, so a
+            # zero-copy view of the capture pool could be overwritten
+            # mid-blend.  Not latency-critical, so the copy is fine.
+            frame_l = cam_l.read()
+            frame_r = cam_r.read()
+
+            if frame_l is None or frame_r is None:
+                time.sleep(0.01)
+                continue
+
+            # Apply horizontal offset from slider to right frame
+            rows, cols, _ = frame_r.shape
+            offset = getattr(self.cfg, 'alignment_offset', 0)
+            translation_matrix = np.float32([[1, 0, offset], [0, 1, 0]])
+            aligned_frame_r = cv2.warpAffine(frame_r, translation_matrix, (cols, rows), borderMode=cv2.BORDER_REPLICATE)
+
+            # Fuse frames in color (simple average)
+            fused_frame = cv2.addWeighted(frame_l, 0.5, aligned_frame_r, 0.5, 0)
+
+            # Encode the frame as JPEG
+            success, buffer = cv2.imencode('.jpg', fused_frame)
+            if not success:
+                time.sleep(0.01)
+                continue
+
+            frame = buffer.tobytes()
 
             yield (b'--frame\r\n'
                    b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
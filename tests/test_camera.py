@@ -0,0 +1,59 @@
+import numpy as np
+from src.camera import CameraCapture
+
+
+class _CountingCap:
+    """Fake ``cv2.VideoCapture``: frame *k* is filled with the value *k*.
+
+    Calls ``on_frame(cam, k)`` before producing each frame and stops the
+    grab loop after *n_frames*.
+    """
+
+    def __init__(self, cam: CameraCapture, n_frames: int, on_frame):
+        self.cam = cam
+        self.n_frames = n_frames
+        self.on_frame = on_frame
+        self.k = 0
+
+    def read(self, dst):
+        self.on_frame(self.cam, self.k)
+        dst[...] = self.k
+        self.k += 1
+        if self.k >= self.n_frames:
+            self.cam._running = False
+        return True, dst
+
+
+def _run_grab_loop(n_frames: int, on_frame) -> CameraCapture:
+    cam = CameraCapture(width=8, height=4, name="fake")
+    cam._cap = _CountingCap(cam, n_frames, on_frame)
+    cam._running = True
+    cam._grab_loop()
+    return cam
+
+
+class TestCameraPool:
+    def test_read_no_copy_view_survives_pool_size_minus_one_publishes(self):
+        keep = CameraCapture.POOL_SIZE - 1
+        held = {}
+
+        def on_frame(cam, k):
+            if k == 1:
+                # Frame 0 is the latest; hold a zero-copy view of it
+                held["view"] = cam.read_no_copy()
+                held["orig"] = held["view"].copy()
+            elif k == 1 + keep:
+                # ``keep`` newer frames have been published since
+                held["after"] = held["view"].copy()
+
+        _run_grab_loop(2 + keep, on_frame)
+
+        assert (held["orig"] == 0).all()
+        np.testing.assert_array_equal(held["after"], held["orig"])
+
+    def test_read_returns_private_copy(self):
+        cam = _run_grab_loop(3, lambda cam, k: None)
+        frame = cam.read()
+        assert frame is not cam.read_no_copy()
+        np.testing.assert_array_equal(frame, cam.read_no_copy())
+        assert (frame == 2).all()
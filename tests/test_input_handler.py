@@ -0,0 +1,176 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from src.config import ControlsCfg
+from src.input_handler import Action, InputHandler
+
+A = Action
+_CONTINUOUS = {A.ZOOM_IN, A.ZOOM_OUT, A.CONVERGE_IN, A.CONVERGE_OUT,
+               A.CALIB_NUDGE_LEFT, A.CALIB_NUDGE_RIGHT}
+# Key bindings of the default ControlsCfg
+_DEFAULT_KEYS = {
+    pygame.K_EQUALS: A.ZOOM_IN, pygame.K_MINUS: A.ZOOM_OUT,
+    pygame.K_RIGHTBRACKET: A.CONVERGE_IN, pygame.K_LEFTBRACKET: A.CONVERGE_OUT,
+    ord("c"): A.TOGGLE_CALIBRATION, ord("a"): A.TOGGLE_ALIGNMENT,
+    ord("n"): A.CALIB_NEXT, pygame.K_LEFT: A.CALIB_NUDGE_LEFT,
+    pygame.K_RIGHT: A.CALIB_NUDGE_RIGHT, ord("r"): A.RESET,
+    pygame.K_ESCAPE: A.QUIT,
+}
+_PEDAL_ADJUST = {
+    ("a", "b"): A.ZOOM_IN, ("a", "c"): A.ZOOM_OUT,
+    ("b", "a"): A.PEDAL_CENTER_LEFT, ("b", "c"): A.PEDAL_CENTER_RIGHT,
+    ("c", "a"): A.PEDAL_CENTER_UP, ("c", "b"): A.PEDAL_CENTER_DOWN,
+}
+
+
+class _RefInput:
+    """The original set-based poll() semantics (keys, pedals, QUIT)."""
+
+    def __init__(self):
+        self.held: set[Action] = set()
+        self.pedal_mode = None
+        self.pedal_adjust: dict[str, Action] = {}
+
+    def poll(self, events) -> set[Action]:
+        one_shot = set()
+        for etype, key in events:
+            if etype == pygame.QUIT:
+                one_shot.add(A.QUIT)
+                continue
+            pedal = chr(key) if key in (ord("a"), ord("b"), ord("c")) else None
+            action = _DEFAULT_KEYS.get(key)
+            if etype == pygame.KEYDOWN:
+                if pedal:
+                    if self.pedal_mode == pedal:
+                        self.pedal_adjust.clear()
+                        self.pedal_mode = None
+                    elif self.pedal_mode is None:
+                        self.pedal_mode = pedal
+                    else:
+                        adj = _PEDAL_ADJUST.get((self.pedal_mode, pedal))
+                        if adj is not None:
+                            one_shot.add(adj)
+                            self.pedal_adjust[pedal] = adj
+                if action is not None:
+                    (self.held if action in _CONTINUOUS else one_shot).add(action)
+            else:
+                self.pedal_adjust.pop(pedal, None)
+                if action is not None:
+                    self.held.discard(action)
+        return self.held | one_shot | set(self.pedal_adjust.values())
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_display():
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def handler():
+    pygame.event.clear()
+    return InputHandler(None, ControlsCfg())
+
+
+def _post(events):
+    for etype, key in events:
+        if etype == pygame.QUIT:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        else:
+            pygame.event.post(pygame.event.Event(
+                etype, key=key, mod=0, unicode="", scancode=0))
+
+
+class TestPollAgainstReference:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_key_sequences(self, handler, seed):
+        rng = np.random.default_rng(seed)
+        keys = list(_DEFAULT_KEYS) + [ord("b"), ord("x")]
+        keys.remove(pygame.K_ESCAPE)
+        down: set[int] = set()
+        ref = _RefInput()
+        for step in range(300):
+            events = []
+            for _ in range(rng.integers(0, 4)):
+                if rng.random() < 0.01:
+                    events.append((pygame.QUIT, 0))
+                    continue
+                key = int(keys[rng.integers(len(keys))])
+                # Keyboards alternate press / release per key
+                etype = pygame.KEYUP if key in down else pygame.KEYDOWN
+                down.symmetric_difference_update((key,))
+                events.append((etype, key))
+            _post(events)
+            got = handler.poll()
+            assert set(got) == ref.poll(events), f"step {step}: {events}"
+
+    def test_mouse_and_window_events_are_ignored(self, handler):
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(1, 1), buttons=(0, 0, 0)))
+        _post([(pygame.KEYDOWN, pygame.K_EQUALS)])
+        assert set(handler.poll()) == {A.ZOOM_IN}
+
+
+class TestHeldAndOneShotSemantics:
+    def test_held_key_repeats_until_released(self, handler):
+        _post([(pygame.KEYDOWN, pygame.K_EQUALS)])
+        assert set(handler.poll()) == {A.ZOOM_IN}
+        assert set(handler.poll()) == {A.ZOOM_IN}
+        _post([(pygame.KEYUP, pygame.K_EQUALS)])
+        assert set(handler.poll()) == set()
+
+    def test_one_shot_fires_once(self, handler):
+        _post([(pygame.KEYDOWN, ord("r"))])
+        assert set(handler.poll()) == {A.RESET}
+        assert set(handler.poll()) == set()
+
+    def test_one_shot_merges_with_held(self, handler):
+        _post([(pygame.KEYDOWN, pygame.K_MINUS), (pygame.KEYDOWN, ord("n"))])
+        assert set(handler.poll()) == {A.ZOOM_OUT, A.CALIB_NEXT}
+        assert set(handler.poll()) == {A.ZOOM_OUT}
+
+    def test_two_keys_same_hold_action_share_one_bit(self):
+        pygame.event.clear()
+        h = InputHandler(None, ControlsCfg(zoom_in=["EQUALS", "z"]))
+        _post([(pygame.KEYDOWN, pygame.K_EQUALS), (pygame.KEYDOWN, ord("z"))])
+        assert set(h.poll()) == {A.ZOOM_IN}
+        # Like the original set: releasing either key drops the action
+        _post([(pygame.KEYUP, ord("z"))])
+        assert set(h.poll()) == set()
+
+    def test_events_posted_before_first_poll_are_kept(self, handler):
+        _post([(pygame.KEYDOWN, ord("c"))])
+        assert A.TOGGLE_CALIBRATION in handler.poll()
+
+    def test_pump_gate_delays_but_does_not_drop_events(self):
+        pygame.event.clear()
+        h = InputHandler(None, ControlsCfg(pump_interval_ms=60_000))
+        h.poll()                                  # installs the event filter
+        h.poll()                                  # starts the gate window
+        _post([(pygame.KEYDOWN, ord("r"))])
+        assert set(h.poll()) == set()             # gated: not pumped yet
+        h._last_pump = 0.0                        # window elapsed
+        assert set(h.poll()) == {A.RESET}
+
+
+class TestNumpadCombos:
+    @pytest.mark.parametrize("first, second, action", [
+        (pygame.K_KP5, pygame.K_KP4, A.ZOOM_IN),
+        (pygame.K_KP5, pygame.K_KP6, A.ZOOM_OUT),
+        (pygame.K_KP6, pygame.K_KP4, A.CALIB_NUDGE_LEFT),
+        (pygame.K_KP6, pygame.K_KP5, A.CALIB_NUDGE_RIGHT),
+        (pygame.K_KP4, pygame.K_KP5, A.PEDAL_CENTER_UP),
+        (pygame.K_KP4, pygame.K_KP6, A.PEDAL_CENTER_DOWN),
+    ])
+    def test_combo_held_in_order(self, handler, first, second, action):
+        _post([(pygame.KEYDOWN, first), (pygame.KEYDOWN, second)])
+        assert set(handler.poll()) == {action}
+        assert set(handler.poll()) == {action}
+        _post([(pygame.KEYUP, second)])
+        assert set(handler.poll()) == set()
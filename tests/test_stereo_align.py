@@ -0,0 +1,254 @@
+import math
+
+import cv2
+import numpy as np
+import pytest
+
+from src.config import AlignmentCfg, StereoCfg
+from src.stereo_align import StereoAligner
+from src.stereo_processor import StereoProcessor
+
+W, H = 1280, 720
+
+
+def _aligner(**kwargs) -> StereoAligner:
+    return StereoAligner(AlignmentCfg(**kwargs), W, H)
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations (the original straightforward versions)
+# ---------------------------------------------------------------------------
+
+def _ref_theil_sen_slope(x, y, min_sep=30.0):
+    slopes = [
+        (y[j] - y[i]) / (x[j] - x[i])
+        for i in range(len(x)) for j in range(i + 1, len(x))
+        if abs(x[j] - x[i]) > min_sep
+    ]
+    return float(np.median(slopes)) if len(slopes) >= 3 else 0.0
+
+
+def _ref_enforce_distribution(pts_l, pts_r, frame_w, frame_h, g):
+    cell_w, cell_h = frame_w / g, frame_h / g
+    buckets: dict[tuple, list] = {}
+    for i in range(len(pts_l)):
+        gx = min(int(pts_l[i, 0] / cell_w), g - 1)
+        gy = min(int(pts_l[i, 1] / cell_h), g - 1)
+        buckets.setdefault((gx, gy), []).append(i)
+    max_per = max(6, len(pts_l) // (g * g) + 1)
+    sel = []
+    for indices in buckets.values():
+        sel.extend(indices[:max_per])
+    idx = np.array(sel)
+    return pts_l[idx], pts_r[idx]
+
+
+def _ref_ratio_matches(des_q, des_t, ratio):
+    """Exact brute-force 2-NN + Lowe ratio test → ``{query: train}``."""
+    q = des_q.astype(np.int64)
+    t = des_t.astype(np.int64)
+    d2 = (q * q).sum(1)[:, None] + (t * t).sum(1)[None, :] - 2 * q @ t.T
+    nn = np.argsort(d2, axis=1, kind="stable")[:, :2]
+    best = d2[np.arange(len(q)), nn[:, 0]]
+    second = d2[np.arange(len(q)), nn[:, 1]]
+    return {i: int(nn[i, 0]) for i in range(len(q))
+            if math.sqrt(best[i]) < ratio * math.sqrt(second[i])}
+
+
+def _ref_mutual(des_l, des_r, ratio):
+    lr = _ref_ratio_matches(des_l, des_r, ratio)
+    rl = _ref_ratio_matches(des_r, des_l, ratio)
+    return sorted((l, r) for l, r in lr.items() if rl.get(r) == l)
+
+
+def _ref_overlap_mask(warp_l, warp_r, w, h):
+    ones = np.full((h, w), 255, dtype=np.uint8)
+    mask_l = cv2.warpAffine(ones, warp_l, (w, h), flags=cv2.INTER_NEAREST,
+                            borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+    mask_r = cv2.warpAffine(ones, warp_r, (w, h), flags=cv2.INTER_NEAREST,
+                            borderMode=cv2.BORDER_CONSTANT, borderValue=0)
+    return cv2.erode(cv2.bitwise_and(mask_l, mask_r), np.ones((5, 5), np.uint8))
+
+
+def _descriptor_pair(seed, n_l=300, n_r=350, n_common=200):
+    """uint8 SIFT-like descriptors where *n_common* rows appear (noisy,
+    shuffled) on both sides and the rest are distractors."""
+    rng = np.random.default_rng(seed)
+    des_l = rng.integers(0, 256, (n_l, 128)).astype(np.uint8)
+    des_r = rng.integers(0, 256, (n_r, 128)).astype(np.uint8)
+    src = rng.choice(n_l, n_common, replace=False)
+    dst = rng.choice(n_r, n_common, replace=False)
+    noise = rng.integers(-12, 13, (n_common, 128))
+    des_r[dst] = np.clip(des_l[src].astype(np.int64) + noise, 0, 255)
+    return des_l, des_r
+
+
+# ---------------------------------------------------------------------------
+# Theil-Sen
+# ---------------------------------------------------------------------------
+
+class TestTheilSen:
+    @staticmethod
+    def _line(n, seed, slope=0.004, intercept=3.0, outliers=0.2):
+        rng = np.random.default_rng(seed)
+        x = rng.uniform(-600, 600, n)
+        y = slope * x + intercept + rng.normal(0, 0.3, n)
+        bad = rng.random(n) < outliers
+        y[bad] += rng.uniform(-40, 40, bad.sum())
+        return x, y
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_exact_path_matches_all_pairs_reference(self, seed):
+        x, y = self._line(150, seed)
+        slope, intercept, _ = StereoAligner._theil_sen(x, y)
+        ref_slope = _ref_theil_sen_slope(x, y)
+        assert slope == pytest.approx(ref_slope, abs=1e-12)
+        assert intercept == pytest.approx(np.median(y - ref_slope * x), abs=1e-9)
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_large_n_close_to_all_pairs_reference(self, seed):
+        # > 200 points used to raise IndexError (double-masked slopes)
+        x, y = self._line(600, seed)
+        slope, intercept, rms = StereoAligner._theil_sen(x, y)
+        ref_slope = _ref_theil_sen_slope(x, y)
+        assert slope == pytest.approx(ref_slope, abs=2e-4)
+        assert intercept == pytest.approx(np.median(y - ref_slope * x), abs=0.1)
+        assert slope == pytest.approx(0.004, abs=5e-4)
+        assert intercept == pytest.approx(3.0, abs=0.2)
+        assert math.isfinite(rms)
+
+    def test_no_x_spread_gives_zero_slope(self):
+        x = np.full(300, 10.0)
+        y = np.arange(300, dtype=np.float64)
+        slope, intercept, _ = StereoAligner._theil_sen(x, y)
+        assert slope == 0.0
+        assert intercept == pytest.approx(np.median(y))
+
+
+# ---------------------------------------------------------------------------
+# Grid distribution
+# ---------------------------------------------------------------------------
+
+class TestEnforceDistribution:
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    def test_matches_bucket_reference(self, seed):
+        rng = np.random.default_rng(seed)
+        # Uniform background plus a dense cluster that must get capped
+        pts = np.concatenate([
+            rng.uniform((0, 0), (W, H), (300, 2)),
+            rng.normal((300, 200), 15, (400, 2)).clip(0, (W - 1, H - 1)),
+            [[W - 0.5, H - 0.5], [0.0, 0.0]],
+        ]).astype(np.float32)
+        pts = pts[rng.permutation(len(pts))]
+        pts_r = pts + np.float32([40, 2])
+
+        al = _aligner()
+        got_l, got_r = al._enforce_distribution(pts, pts_r)
+        ref_l, ref_r = _ref_enforce_distribution(pts, pts_r, W, H, al._GRID)
+        np.testing.assert_array_equal(got_l, ref_l)
+        np.testing.assert_array_equal(got_r, ref_r)
+
+    def test_few_points_are_all_kept(self):
+        pts = np.float32([[10, 10], [20, 20], [700, 400]])
+        got_l, _ = _aligner()._enforce_distribution(pts, pts)
+        np.testing.assert_array_equal(got_l, pts)
+
+
+# ---------------------------------------------------------------------------
+# Descriptor matching
+# ---------------------------------------------------------------------------
+
+class TestMatching:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_cross_check_matches_brute_force_reference(self, seed):
+        des_l, des_r = _descriptor_pair(seed)
+        al = _aligner()
+        got = al._cross_check_match(des_l, des_r)
+        assert got.dtype == np.intp and got.shape[1] == 2
+        assert sorted(map(tuple, got.tolist())) == _ref_mutual(
+            des_l, des_r, al.cfg.match_ratio)
+        assert len(got) > 150
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_one_way_matches_brute_force_reference(self, seed):
+        des_l, des_r = _descriptor_pair(seed)
+        al = _aligner()
+        got = al._one_way_match(des_l, des_r)
+        ref = _ref_ratio_matches(des_l, des_r, al.cfg.match_ratio)
+        assert dict(map(tuple, got.tolist())) == ref
+
+    def test_flann_fallback_agrees_with_brute_force(self):
+        des_l, des_r = _descriptor_pair(5)
+        al = _aligner()
+        exact = set(map(tuple, al._cross_check_match(des_l, des_r).tolist()))
+        al._BF_MAX_PAIRS = 0          # force the KD-tree path
+        approx = set(map(tuple, al._cross_check_match(des_l, des_r).tolist()))
+        assert len(approx & exact) >= 0.9 * len(exact)
+
+    def test_no_ratio_survivors_gives_empty(self):
+        des = np.full((20, 128), 7, np.uint8)   # every distance ties
+        got = _aligner()._cross_check_match(des, des)
+        assert got.shape == (0, 2)
+
+
+# ---------------------------------------------------------------------------
+# Overlap mask
+# ---------------------------------------------------------------------------
+
+class TestOverlapMask:
+    @pytest.mark.parametrize("dy, deg", [(0.0, 0.0), (7.0, 0.4), (-13.3, -1.2), (40.0, 2.0)])
+    def test_matches_warp_reference_up_to_the_border(self, dy, deg):
+        al = _aligner()
+        t = math.radians(deg)
+        al._warp_l = al._rotation_matrix(W / 2, H / 2, t / 2, dy / 2)
+        al._warp_r = al._rotation_matrix(W / 2, H / 2, -t / 2, -dy / 2)
+        al._compute_overlap_mask()
+        ref = _ref_overlap_mask(al._warp_l, al._warp_r, W, H)
+
+        got = al._overlap_mask
+        diff = got != ref
+        assert diff.mean() < 0.005
+        # Disagreements only within a few pixels of the reference's edge
+        k = np.ones((3, 3), np.uint8)
+        edge = cv2.dilate(ref, k, iterations=3) != cv2.erode(ref, k, iterations=3)
+        assert not (diff & ~edge).any()
+        np.testing.assert_array_equal(al._overlap_mask_3ch[:, :, 1], got)
+
+
+# ---------------------------------------------------------------------------
+# Fused align + zoom
+# ---------------------------------------------------------------------------
+
+class TestProcessPairAffine:
+    @pytest.mark.parametrize("zoom", [1.0, 2.0])
+    def test_matches_warp_pair_then_joint_zoom(self, zoom):
+        rng = np.random.default_rng(0)
+        noise = rng.integers(0, 256, (H // 16, W // 16, 3)).astype(np.uint8)
+        frame_l = cv2.resize(noise, (W, H), interpolation=cv2.INTER_CUBIC)
+        frame_r = np.roll(frame_l, 9, axis=1)
+
+        al = _aligner()
+        t = math.radians(0.6)
+        al._warp_l = al._rotation_matrix(W / 2, H / 2, t / 2, 3.0)
+        al._warp_r = al._rotation_matrix(W / 2, H / 2, -t / 2, -3.0)
+        al._compute_overlap_mask()
+
+        eye_w, eye_h = 640, 720
+        proc = StereoProcessor(StereoCfg(), eye_w, eye_h)
+        proc.zoom = zoom
+
+        ref_l, ref_r = (a.copy() for a in al.warp_pair(frame_l, frame_r))
+        ref_l, ref_r, _ = (a.copy() for a in proc.process_pair_joint_zoom(ref_l, ref_r))
+        warp_l, warp_r = al.get_affines()
+        got_l, got_r, sbs = proc.process_pair_affine(
+            frame_l, frame_r, warp_l, warp_r, al.overlap_mask)
+
+        # One interpolation instead of two: compare away from the mask edge
+        both = (ref_l > 0).all(2) & (got_l > 0).all(2)
+        both = cv2.erode(both.astype(np.uint8), np.ones((7, 7), np.uint8)).astype(bool)
+        assert both.mean() > 0.8
+        for got, ref in ((got_l, ref_l), (got_r, ref_r)):
+            d = np.abs(got.astype(np.int16) - ref.astype(np.int16))[both]
+            assert d.mean() < 1.5
+            assert np.percentile(d, 99) <= 6
+        assert np.shares_memory(got_l, sbs) and np.shares_memory(got_r, sbs)